@@ -0,0 +1,183 @@
+"""Run research over a JSONL file of queries without the UI.
+
+Usage:
+    python -m app.batch topics.jsonl --output reports.jsonl --concurrency 4
+
+Each input line is a JSON object with a "query" and an optional "id"; lines
+without an id are numbered. Reports are appended to the output file as they finish, one JSON
+object per line, and the output doubles as the checkpoint: rerunning the same command skips
+every id already reported there, so an interrupted batch picks up where it stopped and failed
+jobs are tried again.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+from app.metrics import format_summary
+from app.research_manager import ResearchManager
+
+
+@dataclass
+class BatchJob:
+    id: str
+    query: str
+
+
+def read_jobs(path: str | Path) -> Iterator[BatchJob]:
+    """Stream jobs from a JSONL file, skipping blank lines."""
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            query = record.get("query")
+            if not query:
+                raise ValueError(f"{path}:{line_number}: job has no 'query'")
+            yield BatchJob(id=str(record.get("id") or line_number), query=query)
+
+
+def completed_ids(path: str | Path) -> set[str]:
+    """Ids of the jobs with a report in an output file, which are skipped on resume."""
+    done: set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("status") == "ok":
+                done.add(str(record["id"]))
+    return done
+
+
+def _drop_partial_line(path: str | Path) -> None:
+    """Cut off a record left half-written by a crash, so appended records start on a fresh line."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+async def research(job: BatchJob, manager_options: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Run one job to completion and describe the outcome as an output record."""
+    started = time.perf_counter()
+    record: dict[str, Any] = {"id": job.id, "query": job.query, "status": "error"}
+    errors = []
+    manager = ResearchManager(**(manager_options or {}))
+    async for event in manager.run(job.query):
+        event_type = event.get("type")
+        if event_type == "report":
+            record.update(status="ok", report=event["markdown"])
+        elif event_type == "error":
+            errors.append(event["text"])
+        elif event_type == "metrics" and event.get("scope") == "run":
+            record["metrics"] = event
+    if errors:
+        record["error"] = "; ".join(errors)
+    record["duration"] = time.perf_counter() - started
+    return record
+
+
+async def iter_batch(
+    jobs: Iterable[BatchJob],
+    concurrency: int = 4,
+    manager_options: dict[str, Any] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Run jobs with at most `concurrency` in flight, yielding records in completion order.
+
+    Jobs are pulled from the iterable only as workers free up, so large job files are never
+    held in memory. All runs share the process-wide caches and agent scheduler, so searches
+    repeated across topics are paid for once.
+    """
+    job_iter = iter(jobs)
+    results: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for job in job_iter:
+                try:
+                    await results.put(await research(job, manager_options))
+                except Exception as e:
+                    await results.put({"id": job.id, "query": job.query, "status": "error", "error": str(e)})
+        finally:
+            await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    remaining = len(workers)
+    try:
+        while remaining:
+            record = await results.get()
+            if record is None:
+                remaining -= 1
+            else:
+                yield record
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+async def run_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    concurrency: int = 4,
+    manager_options: dict[str, Any] | None = None,
+    resume: bool = True,
+) -> dict[str, int]:
+    """Run every job in input_path not yet in output_path, appending a record as each finishes."""
+    done = completed_ids(output_path) if resume else set()
+    if resume:
+        _drop_partial_line(output_path)
+    jobs = (job for job in read_jobs(input_path) if job.id not in done)
+    counts = {"skipped": len(done), "ok": 0, "error": 0}
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out:
+        async for record in iter_batch(jobs, concurrency, manager_options):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            counts[record["status"]] += 1
+            summary = format_summary(record["metrics"]) if "metrics" in record else record.get("error", "")
+            print(f"[{record['status']}] {record['id']}: {summary}", file=sys.stderr)
+    return counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="JSONL file of jobs")
+    parser.add_argument("--output", required=True, help="JSONL file reports are appended to")
+    parser.add_argument("--concurrency", type=int, default=4, help="research runs in flight at once")
+    parser.add_argument("--restart", action="store_true", help="ignore existing output and run every job")
+    parser.add_argument("--no-email", action="store_true", help="do not email reports even if configured")
+    parser.add_argument("--no-cache", action="store_true", help="bypass the search and plan caches")
+    args = parser.parse_args(argv)
+
+    load_dotenv(override=True)
+    if args.no_email:
+        os.environ.pop("SENDGRID_API_KEY", None)
+        os.environ.pop("SMTP_SERVER", None)
+    manager_options = {"use_cache": False, "use_plan_cache": False} if args.no_cache else None
+
+    counts = asyncio.run(
+        run_batch(args.input, args.output, args.concurrency, manager_options, resume=not args.restart)
+    )
+    print(
+        f"{counts['ok']} reports written, {counts['error']} failed, {counts['skipped']} already done",
+        file=sys.stderr,
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+
+class CacheBackend(Protocol):
+    """Minimal interface shared by every cache tier."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class LRUCache:
+    """Bounded in-memory cache with per-entry TTL and least-recently-used eviction."""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 86400.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """On-disk cache tier so summaries survive restarts and are shared between workers."""
+
+    def __init__(self, path: str, ttl: float = 86400.0, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= self._clock():
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + self.ttl),
+            )
+            # Opportunistically drop expired rows so the file does not grow unbounded
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._conn.commit()
+
+
+class TieredCache:
+    """Memory tier in front of an optional disk tier, with hit/miss counters."""
+
+    def __init__(self, memory: CacheBackend, disk: CacheBackend | None = None):
+        self.memory = memory
+        self.disk = disk
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> str | None:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                # Promote so subsequent lookups stay in memory
+                self.memory.set(key, value)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+
+def normalize_search_term(term: str) -> str:
+    """Fold case and whitespace so trivially different search terms share an entry."""
+    return " ".join(term.casefold().split())
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, whitespace and punctuation so near-identical research queries share an entry."""
+    return normalize_search_term(_PUNCTUATION.sub(" ", query))
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def search_cache_key(term: str, model: str, search_context_size: str) -> str:
+    """Content-addressed key for a search summary."""
+    return _digest(normalize_search_term(term), model, search_context_size)
+
+
+def plan_cache_key(query: str, model: str, how_many_searches: int) -> str:
+    """Content-addressed key for a search plan."""
+    return _digest(normalize_query(query), model, str(how_many_searches))
+
+
+def cache_from_env(prefix: str, default_ttl: float, default_max_entries: int) -> TieredCache | None:
+    """Build a cache from <prefix>_TTL, <prefix>_MAX_ENTRIES and <prefix>_PATH env vars.
+
+    A TTL of 0 disables caching entirely.
+    """
+    ttl = float(os.environ.get(f"{prefix}_TTL", str(default_ttl)))
+    if ttl <= 0:
+        return None
+    max_entries = int(os.environ.get(f"{prefix}_MAX_ENTRIES", str(default_max_entries)))
+    path = os.environ.get(f"{prefix}_PATH")
+    disk = SQLiteCache(path, ttl=ttl) if path else None
+    return TieredCache(LRUCache(max_entries=max_entries, ttl=ttl), disk)
+
+
+_shared_caches: dict[str, TieredCache | None] = {}
+
+
+def get_summary_cache() -> TieredCache | None:
+    """Process-wide search summary cache shared by every ResearchManager."""
+    if "summary" not in _shared_caches:
+        _shared_caches["summary"] = cache_from_env("SEARCH_CACHE", 86400, 512)
+    return _shared_caches["summary"]
+
+
+def get_plan_cache() -> TieredCache | None:
+    """Process-wide search plan cache shared by every ResearchManager."""
+    if "plan" not in _shared_caches:
+        _shared_caches["plan"] = cache_from_env("PLAN_CACHE", 3600, 256)
+    return _shared_caches["plan"]
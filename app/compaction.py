@@ -0,0 +1,174 @@
+import re
+from dataclasses import dataclass
+
+from app.scheduler import estimate_tokens
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class CompactionResult:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    sentences_dropped: int
+
+
+def normalize_summary(text: str) -> list[list[str]]:
+    """Split a search summary into paragraphs of sentences, with whitespace and bullets tidied."""
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = [_BULLET.sub("- ", " ".join(line.split())) for line in block.splitlines() if line.strip()]
+        sentences = []
+        for line in lines:
+            sentences.extend(part for part in _SENTENCE_END.split(line) if part)
+        if sentences:
+            paragraphs.append(sentences)
+    return paragraphs
+
+
+def shingles(sentence: str, size: int = 3) -> set[str]:
+    words = [word.casefold() for word in _WORD.findall(sentence)]
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class _NearDuplicateIndex:
+    """Shingle index that finds kept sentences overlapping a new one above a Jaccard threshold."""
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self._kept: list[set[str]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def is_duplicate(self, sentence_shingles: set[str]) -> bool:
+        if not sentence_shingles:
+            return True
+        candidates = {i for shingle in sentence_shingles for i in self._postings.get(shingle, ())}
+        for i in candidates:
+            other = self._kept[i]
+            overlap = len(sentence_shingles & other)
+            if overlap / len(sentence_shingles | other) >= self.threshold:
+                return True
+        return False
+
+    def add(self, sentence_shingles: set[str]) -> None:
+        index = len(self._kept)
+        self._kept.append(sentence_shingles)
+        for shingle in sentence_shingles:
+            self._postings.setdefault(shingle, []).append(index)
+
+
+def compact_results(
+    search_results: list[str],
+    token_budget: int | None = None,
+    similarity_threshold: float = 0.5,
+) -> CompactionResult:
+    """Deduplicate search summaries and fit them into a token budget.
+
+    Sentences that near-duplicate one already kept (by word-shingle Jaccard similarity) are
+    dropped. If the rest still exceeds token_budget, sentences are taken round-robin from
+    each source so every source keeps its leading points.
+    """
+    tokens_before = sum(estimate_tokens(result) for result in search_results)
+    index = _NearDuplicateIndex(similarity_threshold)
+    sources: list[list[list[str]]] = []
+    dropped = 0
+    for result in search_results:
+        paragraphs = []
+        for paragraph in normalize_summary(result):
+            kept = []
+            for sentence in paragraph:
+                sentence_shingles = shingles(sentence)
+                if index.is_duplicate(sentence_shingles):
+                    dropped += 1
+                    continue
+                index.add(sentence_shingles)
+                kept.append(sentence)
+            if kept:
+                paragraphs.append(kept)
+        if paragraphs:
+            sources.append(paragraphs)
+
+    if token_budget is not None:
+        sources, over_budget = _fit_budget(sources, token_budget)
+        dropped += over_budget
+
+    sections = []
+    for number, paragraphs in enumerate(sources, start=1):
+        body = "\n\n".join(" ".join(paragraph) for paragraph in paragraphs)
+        sections.append(f"### Source {number}\n{body}")
+    text = "\n\n".join(sections)
+    return CompactionResult(text, tokens_before, estimate_tokens(text), dropped)
+
+
+def _fit_budget(sources: list[list[list[str]]], token_budget: int) -> tuple[list[list[list[str]]], int]:
+    flat = [[(p, sentence) for p, paragraph in enumerate(paragraphs) for sentence in paragraph] for paragraphs in sources]
+    total = sum(len(flat_source) for flat_source in flat)
+    taken = [0] * len(flat)
+    used = 0
+    progress = True
+    while progress:
+        progress = False
+        for i, flat_source in enumerate(flat):
+            if taken[i] >= len(flat_source):
+                continue
+            cost = estimate_tokens(flat_source[taken[i]][1])
+            if used + cost > token_budget:
+                continue
+            used += cost
+            taken[i] += 1
+            progress = True
+    fitted = []
+    for i, flat_source in enumerate(flat):
+        paragraphs: list[list[str]] = []
+        last = None
+        for p, sentence in flat_source[: taken[i]]:
+            if p != last:
+                paragraphs.append([])
+                last = p
+            paragraphs[-1].append(sentence)
+        if paragraphs:
+            fitted.append(paragraphs)
+    return fitted, total - sum(taken)
+
+
+def cluster_results(search_results: list[str], group_size: int) -> list[list[str]]:
+    """Group related search summaries into clusters of at most group_size for section writing.
+
+    Greedy: each cluster is seeded with the first unassigned summary and filled with the
+    unassigned summaries whose word shingles overlap it most.
+    """
+    signatures = [set().union(*(shingles(s) for p in normalize_summary(r) for s in p)) for r in search_results]
+    unassigned = list(range(len(search_results)))
+    clusters = []
+    while unassigned:
+        seed = unassigned.pop(0)
+        members = [seed]
+
+        def similarity(i: int) -> float:
+            union = signatures[seed] | signatures[i]
+            return len(signatures[seed] & signatures[i]) / len(union) if union else 0.0
+
+        for i in sorted(unassigned, key=similarity, reverse=True)[: group_size - 1]:
+            members.append(i)
+            unassigned.remove(i)
+        clusters.append([search_results[i] for i in sorted(members)])
+    return clusters
+
+
+def build_writer_input(
+    query: str,
+    search_results: list[str],
+    token_budget: int | None = None,
+    outline: str | None = None,
+) -> tuple[str, CompactionResult]:
+    """Assemble the writer prompt from compacted search results."""
+    compacted = compact_results(search_results, token_budget)
+    parts = [f"Original query: {query}", f"Research notes from {len(search_results)} searches:", compacted.text]
+    if outline:
+        parts.append(f"Draft outline:\n{outline}")
+    return "\n\n".join(parts), compacted
@@ -1,27 +1,41 @@
+import os
+
 import gradio as gr
 from dotenv import load_dotenv
 from gradio.themes.default import Default
-from app.research_manager import ResearchManager
+from app.jobs import get_job_queue
+from app.metrics import format_summary
+from app.prometheus import start_metrics_server
 
 load_dotenv(override=True)
 
 
-async def run(query: str):
+async def run(query: str, use_cache: bool = True):
     """Stream status updates and final report.
 
-    Returns a tuple (status_log, report_markdown) progressively.
+    Returns a tuple (status_log, report_markdown) progressively. The run itself executes on the
+    background job queue, so it keeps going if the browser disconnects.
     """
     status_lines: list[str] = []
     report_md: str = ""
-    async for event in ResearchManager().run(query):
+    jobs = get_job_queue()
+    job_id = jobs.submit(query, use_cache=use_cache, use_plan_cache=use_cache)
+    async for event in jobs.subscribe(job_id):
         if isinstance(event, dict):
             et = event.get("type")
-            if et == "status":
+            if et == "run":
+                status_lines.append(f"Run ID: {event.get('run_id', '')}")
+            elif et == "status":
                 status_lines.append(str(event.get("text", "")))
             elif et == "error":
                 status_lines.append(f"ERROR: {event.get('text', '')}")
             elif et == "report":
                 report_md = str(event.get("markdown", ""))
+            elif et == "metrics":
+                # Per-stage/per-call metrics are for programmatic consumers; show the run summary only
+                if event.get("scope") != "run":
+                    continue
+                status_lines.append(format_summary(event))
         else:
             # Backward compat if any string yields remain
             status_lines.append(str(event))
@@ -32,19 +46,28 @@ def build_ui() -> gr.Blocks:
     with gr.Blocks(theme=Default(primary_hue="sky")) as demo:
         gr.Markdown("# Deep Research")
         query_textbox = gr.Textbox(label="What topic would you like to research?")
+        use_cache = gr.Checkbox(value=True, label="Reuse cached search plans and results")
         run_button = gr.Button("Run", variant="primary")
 
         # Smaller status box stacked above the final report
         status = gr.Textbox(label="Status", lines=6)
         report = gr.Markdown(label="Report")
 
-        run_button.click(fn=run, inputs=query_textbox, outputs=[status, report])
-        query_textbox.submit(fn=run, inputs=query_textbox, outputs=[status, report])
+        run_button.click(fn=run, inputs=[query_textbox, use_cache], outputs=[status, report])
+        query_textbox.submit(fn=run, inputs=[query_textbox, use_cache], outputs=[status, report])
     return demo
 
 
+def start_metrics_exporter() -> None:
+    """Serve Prometheus metrics on METRICS_PORT alongside the UI, if configured."""
+    port = os.environ.get("METRICS_PORT")
+    if port:
+        start_metrics_server(int(port))
+
+
 # Expose a top-level Gradio app object for Spaces
 demo = build_ui()
+start_metrics_exporter()
 
 
 if __name__ == "__main__":
@@ -4,9 +4,21 @@ from email.mime.text import MIMEText
 
 from agents import Agent, function_tool
 
+from app import prometheus
+
 
 def _send_email_impl(subject: str, html_body: str) -> dict[str, str]:
     """Pure implementation used by tests and the tool wrapper."""
+    try:
+        result = _deliver_email(subject, html_body)
+    except Exception:
+        prometheus.EMAILS.inc(status="error", via="sendgrid")
+        raise
+    prometheus.EMAILS.inc(status=result["status"], via=result.get("via", "none"))
+    return result
+
+
+def _deliver_email(subject: str, html_body: str) -> dict[str, str]:
     from_email = os.environ.get("FROM_EMAIL", "noreply@example.com")
     to_email = os.environ.get("TO_EMAIL", "recipient@example.com")
 
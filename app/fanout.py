@@ -0,0 +1,43 @@
+import os
+from dataclasses import dataclass
+
+from app.planner_agent import HOW_MANY_SEARCHES, SearchContextSize, WebSearchPlan
+
+CONTEXT_SIZES: tuple[SearchContextSize, ...] = ("low", "medium", "high")
+
+
+@dataclass
+class SearchBudget:
+    """Upper bounds on the searching one research run may do.
+
+    The planner sizes the plan to the query within max_searches and picks a search context
+    size per search up to max_context_size. gap_searches allows a second round of follow-up
+    searches for aspects the first round missed (0 disables it).
+    """
+
+    max_searches: int = HOW_MANY_SEARCHES
+    max_context_size: SearchContextSize = "medium"
+    gap_searches: int = 0
+
+
+def clamp_plan(plan: WebSearchPlan, max_searches: int, max_context_size: SearchContextSize) -> WebSearchPlan:
+    """Trim a plan to the budget, in case the model planned more or deeper searches than allowed."""
+    ceiling = CONTEXT_SIZES.index(max_context_size)
+    searches = [
+        item
+        if CONTEXT_SIZES.index(item.search_context_size) <= ceiling
+        else item.model_copy(update={"search_context_size": max_context_size})
+        for item in plan.searches[: max(0, max_searches)]
+    ]
+    return WebSearchPlan(searches=searches)
+
+
+def search_budget_from_env() -> SearchBudget:
+    max_context_size = os.environ.get("SEARCH_MAX_CONTEXT_SIZE", "medium")
+    if max_context_size not in CONTEXT_SIZES:
+        raise ValueError(f"SEARCH_MAX_CONTEXT_SIZE must be one of {', '.join(CONTEXT_SIZES)}")
+    return SearchBudget(
+        max_searches=int(os.environ.get("HOW_MANY_SEARCHES", str(HOW_MANY_SEARCHES))),
+        max_context_size=max_context_size,
+        gap_searches=int(os.environ.get("SEARCH_GAP_ROUND_SEARCHES", "0")),
+    )
@@ -0,0 +1,57 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class LatencyTracker:
+    """Rolling window of recent call latencies, used to pick a hedging delay."""
+
+    def __init__(self, window: int = 200, min_samples: int = 5):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """Latency at percentile p (0-1), or None until enough samples have been seen."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(p * (len(ordered) - 1))))
+        return ordered[index]
+
+
+async def hedged(
+    fn: Callable[[], Awaitable[Any]],
+    hedge_after: float | None,
+    on_hedge: Callable[[], None] | None = None,
+) -> Any:
+    """Await fn(), launching one duplicate attempt if it has not finished after hedge_after seconds.
+
+    The first attempt to succeed wins and the other is cancelled. If both fail, the last
+    error is raised.
+    """
+    tasks = [asyncio.ensure_future(fn())]
+    try:
+        if hedge_after is not None:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                if on_hedge is not None:
+                    on_hedge()
+                tasks.append(asyncio.ensure_future(fn()))
+        while True:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            error: BaseException | None = None
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task.result()
+            tasks = [task for task in tasks if not task.done()]
+            if not tasks:
+                raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
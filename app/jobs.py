@@ -0,0 +1,213 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.research_manager import ResearchManager
+from app.singleflight import EventBroadcast
+
+
+@dataclass
+class Job:
+    id: str
+    query: str
+    options: dict[str, Any] = field(default_factory=dict)
+    # queued, running, completed or failed
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    report: str | None = None
+    error: str | None = None
+    broadcast: EventBroadcast = field(default_factory=EventBroadcast)
+
+
+class JobQueue:
+    """Runs research jobs on a pool of background workers, independent of any client connection.
+
+    submit() returns a job ID straight away; clients then poll() for new events or subscribe()
+    to stream them, and can drop off and come back without affecting the run. Job IDs double as
+    run IDs, so with a run store configured, jobs interrupted by a restart can be resubmitted and
+    pick up from their checkpoints.
+
+    With processes > 0, jobs run in that many worker processes (each running `workers` jobs at
+    a time) and their events are relayed back to this process; otherwise `workers` jobs run
+    concurrently on the current event loop. Finished jobs are forgotten after `retention`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        processes: int = 0,
+        retention: float = 3600.0,
+        manager_options: dict[str, Any] | None = None,
+    ):
+        self.workers = max(1, workers)
+        self.processes = processes
+        self.retention = retention
+        self.manager_options = manager_options or {}
+        self.jobs: dict[str, Job] = {}
+        self._queue: asyncio.Queue[Job] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._task_queue: Any = None
+        self._event_queue: Any = None
+        self._processes: list[multiprocessing.Process] = []
+
+    def submit(self, query: str, job_id: str | None = None, **manager_options: Any) -> str:
+        """Queue a research run and return its job ID; manager_options override the queue's defaults."""
+        self._start()
+        self._prune()
+        job = Job(id=job_id or uuid.uuid4().hex, query=query, options={**self.manager_options, **manager_options})
+        self.jobs[job.id] = job
+        job.broadcast.publish({"type": "status", "text": f"Job {job.id} queued ({self.queued} waiting)"})
+        if self.processes:
+            self._task_queue.put((job.id, job.query, job.options))
+        else:
+            self._queue.put_nowait(job)
+        return job.id
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for job in self.jobs.values() if job.status == "queued")
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def poll(self, job_id: str, after: int = 0) -> dict[str, Any]:
+        """The job's status and the events it has published since the first `after`."""
+        job = self._job(job_id)
+        events = job.broadcast.events
+        return {"id": job.id, "status": job.status, "events": events[after:], "next": len(events)}
+
+    async def subscribe(self, job_id: str):
+        """Replay the job's events so far, then stream new ones until the job finishes."""
+        async for event in self._job(job_id).broadcast.subscribe():
+            yield event
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs still running are abandoned."""
+        if self._event_queue is not None:
+            # Wakes the relay task's blocking read so its thread can exit
+            self._event_queue.put(None)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._processes:
+            for _ in range(len(self._processes) * self.workers):
+                self._task_queue.put(None)
+            for process in self._processes:
+                await asyncio.to_thread(process.join, 5)
+                if process.is_alive():
+                    process.terminate()
+            self._processes = []
+
+    def _job(self, job_id: str) -> Job:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown job {job_id}")
+        return job
+
+    def _start(self) -> None:
+        if self._tasks:
+            return
+        if self.processes:
+            context = multiprocessing.get_context("spawn")
+            self._task_queue = context.Queue()
+            self._event_queue = context.Queue()
+            for _ in range(self.processes):
+                process = context.Process(
+                    target=_process_main, args=(self._task_queue, self._event_queue, self.workers), daemon=True
+                )
+                process.start()
+                self._processes.append(process)
+            self._tasks.append(asyncio.create_task(self._relay_events()))
+        else:
+            self._queue = asyncio.Queue()
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        for job_id in [job.id for job in self.jobs.values() if job.finished_at and job.finished_at < cutoff]:
+            del self.jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                async for event in ResearchManager(**job.options).run(job.query, run_id=job.id):
+                    self._record(job, event)
+            except Exception as e:
+                self._record(job, {"type": "error", "text": f"Unexpected error: {e}"})
+            self._finish(job)
+
+    async def _relay_events(self) -> None:
+        while True:
+            item = await asyncio.to_thread(self._event_queue.get)
+            if item is None:
+                return
+            job_id, event = item
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            if event is None:
+                self._finish(job)
+                continue
+            if job.status == "queued":
+                job.status = "running"
+                job.started_at = time.time()
+            self._record(job, event)
+
+    def _record(self, job: Job, event: dict[str, Any]) -> None:
+        if event.get("type") == "report":
+            job.report = event["markdown"]
+        elif event.get("type") == "error":
+            job.error = event["text"]
+        job.broadcast.publish(event)
+
+    def _finish(self, job: Job) -> None:
+        job.status = "completed" if job.report is not None and job.error is None else "failed"
+        job.finished_at = time.time()
+        job.broadcast.close()
+
+
+def _process_main(task_queue, event_queue, workers: int) -> None:
+    """Entry point of a worker process: run queued jobs and send their events back."""
+
+    async def worker() -> None:
+        while True:
+            task = await asyncio.to_thread(task_queue.get)
+            if task is None:
+                return
+            job_id, query, options = task
+            try:
+                async for event in ResearchManager(**options).run(query, run_id=job_id):
+                    event_queue.put((job_id, event))
+            except Exception as e:
+                event_queue.put((job_id, {"type": "error", "text": f"Unexpected error: {e}"}))
+            event_queue.put((job_id, None))
+
+    async def serve() -> None:
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    asyncio.run(serve())
+
+
+_shared_queue: dict[str, JobQueue] = {}
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide job queue sized by JOB_WORKERS, JOB_WORKER_PROCESSES and JOB_RETENTION_SECONDS."""
+    if "queue" not in _shared_queue:
+        _shared_queue["queue"] = JobQueue(
+            workers=int(os.environ.get("JOB_WORKERS", "4")),
+            processes=int(os.environ.get("JOB_WORKER_PROCESSES", "0")),
+            retention=float(os.environ.get("JOB_RETENTION_SECONDS", "3600")),
+        )
+    return _shared_queue["queue"]
@@ -0,0 +1,128 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class TokenUsage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+
+    def add(self, other: "TokenUsage") -> None:
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.total_tokens += other.total_tokens
+
+
+def usage_from_result(result: Any) -> TokenUsage | None:
+    """Token usage reported by a Runner.run result, if the result carries any."""
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    if usage is None:
+        return None
+    return TokenUsage(
+        input_tokens=getattr(usage, "input_tokens", 0) or 0,
+        output_tokens=getattr(usage, "output_tokens", 0) or 0,
+        total_tokens=getattr(usage, "total_tokens", 0) or 0,
+    )
+
+
+@dataclass
+class RunMetrics:
+    """Timings, token usage and cache outcomes collected over one research run.
+
+    Each record_* method returns the `{"type": "metrics", ...}` event describing what was
+    recorded, so callers can stream it as it happens; summary() aggregates the whole run.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    stages: dict[str, float] = field(default_factory=dict)
+    search_durations: list[float] = field(default_factory=list)
+    agent_calls: int = 0
+    queue_wait: float = 0.0
+    tokens: TokenUsage = field(default_factory=TokenUsage)
+    tokens_by_agent: dict[str, TokenUsage] = field(default_factory=dict)
+    search_cache_hits: int = 0
+    search_cache_misses: int = 0
+    plan_cache_hit: bool = False
+    writer_tokens_saved: int = 0
+
+    def record_stage(self, stage: str, duration: float) -> dict[str, Any]:
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+        return {"type": "metrics", "scope": "stage", "stage": stage, "duration": duration}
+
+    def record_search(self, query: str, duration: float, cached: bool, ok: bool) -> dict[str, Any]:
+        self.search_durations.append(duration)
+        return {
+            "type": "metrics",
+            "scope": "search",
+            "query": query,
+            "duration": duration,
+            "cached": cached,
+            "ok": ok,
+        }
+
+    def record_agent_call(
+        self, agent: str, duration: float, queue_wait: float, usage: TokenUsage | None
+    ) -> dict[str, Any]:
+        self.agent_calls += 1
+        self.queue_wait += queue_wait
+        event = {
+            "type": "metrics",
+            "scope": "agent_call",
+            "agent": agent,
+            "duration": duration,
+            "queue_wait": queue_wait,
+        }
+        if usage is not None:
+            self.tokens.add(usage)
+            self.tokens_by_agent.setdefault(agent, TokenUsage()).add(usage)
+            event.update(
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+                total_tokens=usage.total_tokens,
+            )
+        return event
+
+    def record_compaction(self, compacted: Any) -> dict[str, Any]:
+        """Record how much a CompactionResult shrank the writer input."""
+        self.writer_tokens_saved += max(0, compacted.tokens_before - compacted.tokens_after)
+        return {
+            "type": "metrics",
+            "scope": "compaction",
+            "tokens_before": compacted.tokens_before,
+            "tokens_after": compacted.tokens_after,
+            "sentences_dropped": compacted.sentences_dropped,
+        }
+
+    def summary(self) -> dict[str, Any]:
+        searches = sorted(self.search_durations)
+        return {
+            "type": "metrics",
+            "scope": "run",
+            "duration": time.perf_counter() - self.started,
+            "stages": dict(self.stages),
+            "searches": len(searches),
+            "search_p50": searches[len(searches) // 2] if searches else None,
+            "search_max": searches[-1] if searches else None,
+            "agent_calls": self.agent_calls,
+            "queue_wait": self.queue_wait,
+            "input_tokens": self.tokens.input_tokens,
+            "output_tokens": self.tokens.output_tokens,
+            "total_tokens": self.tokens.total_tokens,
+            "tokens_by_agent": {name: usage.total_tokens for name, usage in self.tokens_by_agent.items()},
+            "search_cache_hits": self.search_cache_hits,
+            "search_cache_misses": self.search_cache_misses,
+            "plan_cache_hit": self.plan_cache_hit,
+            "writer_tokens_saved": self.writer_tokens_saved,
+        }
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    """One-line human readable rendering of a run summary event."""
+    stages = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in summary["stages"].items())
+    return (
+        f"Run finished in {summary['duration']:.1f}s ({stages}); "
+        f"{summary['agent_calls']} agent calls, {summary['total_tokens']} tokens, "
+        f"{summary['queue_wait']:.1f}s queued"
+    )
@@ -1,15 +1,32 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 from agents import Agent
 
 HOW_MANY_SEARCHES = 5
 
+SearchContextSize = Literal["low", "medium", "high"]
+
 INSTRUCTIONS = f"You are a helpful research assistant. Given a query, come up with a set of web searches \
-to perform to best answer the query. Output {HOW_MANY_SEARCHES} terms to query for."
+to perform to best answer the query. Scale the plan to the query: a simple factual lookup needs one or two \
+searches, while a broad or multi-part topic should use up to the maximum number of searches given \
+({HOW_MANY_SEARCHES} if none is given), each covering a distinct aspect of the query. For each search choose \
+a search context size: 'low' for quick facts, 'medium' or 'high' only where the depth of sources matters, \
+and never above the maximum search context size given."
+
+GAP_INSTRUCTIONS = "You are a helpful research assistant. You will be given a query, the web searches \
+already performed for it and a summary of their results. Identify important aspects of the query that the \
+results leave uncovered and come up with follow-up web searches for them, at most the maximum number given. \
+Return no searches if the results already cover the query well. Use the same search context size rules: \
+'low' unless depth of sources matters, and never above the maximum given."
 
 
 class WebSearchItem(BaseModel):
     reason: str = Field(description="Your reasoning for why this search is important to the query.")
     query: str = Field(description="The search term to use for the web search.")
+    search_context_size: SearchContextSize = Field(
+        default="low", description="How much web content the search should retrieve."
+    )
 
 
 class WebSearchPlan(BaseModel):
@@ -23,4 +40,9 @@ planner_agent = Agent(
     output_type=WebSearchPlan,
 )
 
-
+gap_agent = Agent(
+    name="GapAgent",
+    instructions=GAP_INSTRUCTIONS,
+    model="gpt-4o-mini",
+    output_type=WebSearchPlan,
+)
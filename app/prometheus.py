@@ -0,0 +1,198 @@
+import bisect
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from app.scheduler import get_scheduler
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: dict[tuple[tuple[str, str], ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(key)} {value}" for key, value in self._values.items()]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, function: Callable[[], float] | None = None):
+        super().__init__(name, help)
+        self._value = 0.0
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def value(self) -> float:
+        return self._function() if self._function is not None else self._value
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name} {self.value()}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...]):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[tuple[str, str], ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts, totals = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            totals[0] += value
+
+    def _samples(self) -> list[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, totals) in self._series.items():
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float("inf")), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{self.name}_bucket{_format_labels((*key, ('le', le)))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {totals[0]}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+_LATENCY_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+RUNS = Counter("deep_research_runs_total", "Research runs finished, by outcome.")
+RUN_DURATION = Histogram("deep_research_run_duration_seconds", "Wall-clock duration of research runs.", _LATENCY_BUCKETS)
+STAGE_DURATION = Histogram(
+    "deep_research_stage_duration_seconds", "Wall-clock duration of pipeline stages.", _LATENCY_BUCKETS
+)
+SEARCHES = Counter("deep_research_searches_total", "Searches performed, by outcome.")
+AGENT_CALLS = Counter("deep_research_agent_calls_total", "Agent calls made, by agent.")
+AGENT_TOKENS = Counter("deep_research_agent_tokens_total", "Tokens used by agent calls, by agent.")
+EMAILS = Counter("deep_research_emails_total", "Email delivery attempts, by status and provider.")
+ACTIVE_RUNS = Gauge("deep_research_active_runs", "Research runs currently executing.")
+AGENT_CALLS_IN_FLIGHT = Gauge(
+    "deep_research_agent_calls_in_flight", "Agent calls currently running.", lambda: get_scheduler().in_flight
+)
+AGENT_CALLS_QUEUED = Gauge(
+    "deep_research_agent_calls_queued", "Agent calls waiting for scheduler capacity.", lambda: get_scheduler().queue_depth
+)
+
+REGISTRY: list[_Metric] = [
+    RUNS,
+    RUN_DURATION,
+    STAGE_DURATION,
+    SEARCHES,
+    AGENT_CALLS,
+    AGENT_TOKENS,
+    EMAILS,
+    ACTIVE_RUNS,
+    AGENT_CALLS_IN_FLIGHT,
+    AGENT_CALLS_QUEUED,
+]
+
+
+def observe_event(event: dict[str, Any]) -> None:
+    """Update the process-wide metrics from one ResearchManager event."""
+    event_type = event.get("type")
+    if event_type == "error":
+        RUNS.inc(outcome="error")
+        return
+    if event_type != "metrics":
+        return
+    scope = event.get("scope")
+    if scope == "run":
+        RUNS.inc(outcome="success")
+        RUN_DURATION.observe(event["duration"])
+    elif scope == "stage":
+        STAGE_DURATION.observe(event["duration"], stage=event["stage"])
+    elif scope == "search":
+        outcome = "cached" if event["cached"] else ("ok" if event["ok"] else "failed")
+        SEARCHES.inc(outcome=outcome)
+    elif scope == "agent_call":
+        AGENT_CALLS.inc(agent=event["agent"])
+        if event.get("total_tokens"):
+            AGENT_TOKENS.inc(event["total_tokens"], agent=event["agent"])
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would otherwise flood the app log
+        pass
+
+
+_server: ThreadingHTTPServer | None = None
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serve /metrics on a background thread; repeated calls reuse the running server."""
+    global _server
+    if _server is None:
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        threading.Thread(target=_server.serve_forever, name="metrics-exporter", daemon=True).start()
+    return _server
@@ -1,45 +1,311 @@
 from agents import Runner, trace, gen_trace_id
-from app.search_agent import search_agent
-from app.planner_agent import planner_agent, WebSearchItem, WebSearchPlan
-from app.writer_agent import writer_agent, ReportData
+from app.cache import (
+    CacheStats,
+    TieredCache,
+    get_plan_cache,
+    get_summary_cache,
+    normalize_query,
+    plan_cache_key,
+    search_cache_key,
+)
+from app.fanout import SearchBudget, clamp_plan, search_budget_from_env
+from app.compaction import build_writer_input, cluster_results, compact_results
+from app.hedging import LatencyTracker, hedged
+from app.metrics import RunMetrics, usage_from_result
+from app import prometheus
+from app.run_store import RunStore, StoredRun, get_run_store
+from app.retry import RetryPolicy, call_with_retry, retry_policy_from_env
+from app.scheduler import AgentScheduler, estimate_tokens, get_scheduler
+from app.singleflight import EventBroadcast, SingleFlight
+from app.streaming import ReportStream
+from app.search_agent import search_agent_for
+from app.planner_agent import planner_agent, gap_agent, WebSearchItem, WebSearchPlan
+from app.writer_agent import (
+    writer_agent,
+    outline_agent,
+    section_writer_agent,
+    editor_agent,
+    ReportData,
+    ReportFrame,
+    ReportOutline,
+    ReportSection,
+)
 from app.email_agent import email_agent
 import asyncio
+import math
 import os
+import time
+import uuid
+
+# Runs and searches currently executing in this process, keyed on their normalized input
+_inflight_runs: dict[str, EventBroadcast] = {}
+_inflight_searches = SingleFlight()
+# Recent search latencies across all runs, used to decide when to hedge
+_search_latency = LatencyTracker()
 
 
 class ResearchManager:
 
-    async def run(self, query: str):
+    def __init__(
+        self,
+        summary_cache: TieredCache | None = None,
+        use_cache: bool = True,
+        plan_cache: TieredCache | None = None,
+        use_plan_cache: bool = True,
+        search_quorum: float | None = None,
+        straggler_grace: float | None = None,
+        pipelined_writing: bool | None = None,
+        search_timeout: float | None = None,
+        run_deadline: float | None = None,
+        hedge_percentile: float | None = None,
+        scheduler: AgentScheduler | None = None,
+        session_id: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+        runner=Runner,
+        writer_token_budget: int | None = None,
+        search_budget: SearchBudget | None = None,
+        map_reduce_threshold: int | None = None,
+        sources_per_section: int | None = None,
+        run_store: RunStore | None = None,
+        stream_report: bool | None = None,
+    ):
+        """Create a manager.
+
+        summary_cache and plan_cache default to the process-wide caches configured by the
+        SEARCH_CACHE_* and PLAN_CACHE_* env vars; pass use_cache=False or use_plan_cache=False
+        to bypass them for this manager's runs.
+
+        search_quorum is the fraction of planned searches that must finish before writing starts;
+        stragglers get straggler_grace more seconds and are then dropped. pipelined_writing drafts
+        the report outline from early results while the remaining searches run. Unset values
+        fall back to SEARCH_QUORUM, STRAGGLER_GRACE_SECONDS and PIPELINED_WRITING.
+
+        search_timeout bounds each search and run_deadline the whole run (searches still pending
+        when only RUN_DEADLINE_WRITE_RESERVE_SECONDS remain are dropped so the report can be
+        written). With hedge_percentile set, a search slower than that percentile of recent
+        searches gets a duplicate request and the first answer wins. Unset values fall back to
+        SEARCH_TIMEOUT_SECONDS, RUN_DEADLINE_SECONDS and SEARCH_HEDGE_PERCENTILE.
+
+        Every agent call goes through scheduler (the process-wide AgentScheduler by default),
+        queued fairly against other sessions under session_id. Transient failures are retried
+        according to retry_policy (RETRY_* env vars by default). runner is the agents SDK
+        Runner unless a substitute (e.g. the benchmark's simulated runner) is passed.
+
+        Search summaries are deduplicated and trimmed to writer_token_budget tokens
+        (WRITER_INPUT_TOKEN_BUDGET, default 6000; 0 means no limit) before reaching the writer.
+
+        search_budget bounds the planned searches and their search context size (HOW_MANY_SEARCHES,
+        SEARCH_MAX_CONTEXT_SIZE by default); within it the planner scales the plan to the query.
+        With search_budget.gap_searches (SEARCH_GAP_ROUND_SEARCHES) set, a second round searches
+        for gaps left by the first, if the run deadline allows. With at least
+        map_reduce_threshold results (MAP_REDUCE_THRESHOLD, default 8; 0 disables), the report is
+        written map-reduce style: clusters of sources_per_section related summaries
+        (SOURCES_PER_SECTION, default 5) are written up as sections in parallel, then an editor
+        pass adds the title, introduction and conclusion.
+
+        With a run_store (the store at RUN_STORE_PATH by default) the plan, every search summary
+        and the report are checkpointed under the run ID as they complete, so resume(run_id)
+        can pick up an interrupted run from its last completed stage.
+
+        With stream_report (STREAM_REPORT, on by default) the single writer streams its output
+        and the markdown is published as report_delta events while it is being written.
+        """
+        self.summary_cache = (summary_cache or get_summary_cache()) if use_cache else None
+        self.plan_cache = (plan_cache or get_plan_cache()) if use_plan_cache else None
+        self.cache_stats = CacheStats()
+        self.plan_cache_hit = False
+        if search_quorum is None:
+            search_quorum = float(os.environ.get("SEARCH_QUORUM", "1.0"))
+        self.search_quorum = min(max(search_quorum, 0.0), 1.0)
+        if straggler_grace is None:
+            straggler_grace = float(os.environ.get("STRAGGLER_GRACE_SECONDS", "0"))
+        self.straggler_grace = straggler_grace
+        if pipelined_writing is None:
+            pipelined_writing = os.environ.get("PIPELINED_WRITING", "0") not in ("", "0", "false", "False")
+        self.pipelined_writing = pipelined_writing
+        self.stragglers_dropped = 0
+        if search_timeout is None:
+            search_timeout = float(os.environ.get("SEARCH_TIMEOUT_SECONDS", "90"))
+        self.search_timeout = search_timeout
+        if run_deadline is None and os.environ.get("RUN_DEADLINE_SECONDS"):
+            run_deadline = float(os.environ["RUN_DEADLINE_SECONDS"])
+        self.run_deadline = run_deadline
+        self.write_reserve = float(os.environ.get("RUN_DEADLINE_WRITE_RESERVE_SECONDS", "60"))
+        if hedge_percentile is None and os.environ.get("SEARCH_HEDGE_PERCENTILE"):
+            hedge_percentile = float(os.environ["SEARCH_HEDGE_PERCENTILE"])
+        self.hedge_percentile = hedge_percentile
+        self.search_failures: list[str] = []
+        self._deadline: float | None = None
+        self._broadcast: EventBroadcast | None = None
+        self.scheduler = scheduler or get_scheduler()
+        self.session_id = session_id or uuid.uuid4().hex
+        self.retry_policy = retry_policy or retry_policy_from_env()
+        self.metrics = RunMetrics()
+        self.runner = runner
+        if writer_token_budget is None:
+            writer_token_budget = int(os.environ.get("WRITER_INPUT_TOKEN_BUDGET", "6000"))
+        self.writer_token_budget = writer_token_budget or None
+        self.search_budget = search_budget or search_budget_from_env()
+        if map_reduce_threshold is None:
+            map_reduce_threshold = int(os.environ.get("MAP_REDUCE_THRESHOLD", "8"))
+        self.map_reduce_threshold = map_reduce_threshold
+        if sources_per_section is None:
+            sources_per_section = int(os.environ.get("SOURCES_PER_SECTION", "5"))
+        self.sources_per_section = max(1, sources_per_section)
+        self.run_store = run_store or get_run_store()
+        self.run_id: str | None = None
+        if stream_report is None:
+            stream_report = os.environ.get("STREAM_REPORT", "1") not in ("", "0", "false", "False")
+        self.stream_report = stream_report
+
+    def _emit(self, event: dict) -> None:
+        """Publish an event from inside a stage, alongside the events the pipeline yields"""
+        prometheus.observe_event(event)
+        if self._broadcast is not None:
+            self._broadcast.publish(event)
+
+    def _time_left(self) -> float | None:
+        """Seconds until the run deadline, or None when the run has no deadline"""
+        if self._deadline is None:
+            return None
+        return self._deadline - asyncio.get_running_loop().time()
+
+    async def _run_agent(self, agent, input: str, expected_output_tokens: int = 1000, stream: ReportStream | None = None):
+        """Run an agent once it is granted capacity by the scheduler, retrying transient failures.
+
+        With a stream, the agent's output is streamed and its raw text deltas are fed to it.
+        """
+        estimated = estimate_tokens(input) + expected_output_tokens
+
+        async def attempt():
+            async with self.scheduler.slot(self.session_id, estimated) as slot:
+                if slot.waited >= 1:
+                    self._emit(
+                        {"type": "status", "text": f"Waited {slot.waited:.1f}s for agent capacity ({agent.name})"}
+                    )
+                started = time.perf_counter()
+                if stream is None:
+                    result = await self.runner.run(agent, input)
+                else:
+                    stream.start()
+                    result = self.runner.run_streamed(agent, input)
+                    async for event in result.stream_events():
+                        if event.type == "raw_response_event" and event.data.type == "response.output_text.delta":
+                            stream.feed(event.data.delta)
+                    stream.flush()
+                usage = usage_from_result(result)
+                slot.actual_tokens = usage.total_tokens if usage is not None else None
+            self._emit(self.metrics.record_agent_call(agent.name, time.perf_counter() - started, slot.waited, usage))
+            return result
+
+        def on_retry(attempt_number: int, delay: float, error: BaseException):
+            self._emit(
+                {
+                    "type": "status",
+                    "text": (
+                        f"{agent.name} attempt {attempt_number}/{self.retry_policy.max_attempts} failed "
+                        f"({error}), retrying in {delay:.1f}s"
+                    ),
+                }
+            )
+
+        return await call_with_retry(attempt, self.retry_policy, on_retry)
+
+    async def run(self, query: str, run_id: str | None = None):
         """Run the deep research process, yielding structured events.
 
         Events are dicts with a 'type' key:
+        - {"type": "run", "run_id": str}
         - {"type": "status", "text": str}
         - {"type": "error", "text": str}
+        - {"type": "report_delta", "text": str, "reset": bool (only when true)}
         - {"type": "report", "markdown": str}
+        - {"type": "metrics", "scope": "stage" | "search" | "agent_call" | "run", ...}
+
+        report_delta events carry the report's markdown as the writer produces it; a reset means
+        the writer was retried and the text so far should be discarded. The report event still
+        carries the complete markdown.
+
+        Metrics events carry wall-clock durations, queue waits, token usage and cache outcomes;
+        the "run" scope event at the end summarizes the whole run.
+
+        If an identical query (after normalization) is already running in this process, the
+        caller joins that run instead: earlier events are replayed, then live events follow.
+
+        run_id names the run in the run store; a new ID is generated when none is given.
+        """
+        key = normalize_query(query) if run_id is None else f"run:{run_id}"
+        broadcast = _inflight_runs.get(key)
+        if broadcast is None:
+            broadcast = EventBroadcast()
+            _inflight_runs[key] = broadcast
+            broadcast.task = asyncio.create_task(self._publish_run(key, query, broadcast, run_id))
+        else:
+            yield {"type": "status", "text": "Joining identical research run already in progress..."}
+        async for event in broadcast.subscribe():
+            yield event
+
+    async def resume(self, run_id: str):
+        """Continue a checkpointed run from its last completed stage, yielding events like run()"""
+        stored = self.run_store.get_run(run_id) if self.run_store is not None else None
+        if stored is None:
+            yield {"type": "error", "text": f"No stored run with ID {run_id}"}
+            return
+        async for event in self.run(stored.query, run_id=run_id):
+            yield event
+
+    async def _publish_run(self, key: str, query: str, broadcast: EventBroadcast, run_id: str | None = None) -> None:
+        self._broadcast = broadcast
+        prometheus.ACTIVE_RUNS.inc()
+        try:
+            async for event in self._run_pipeline(query, run_id):
+                self._emit(event)
+        finally:
+            prometheus.ACTIVE_RUNS.dec()
+            if _inflight_runs.get(key) is broadcast:
+                del _inflight_runs[key]
+            broadcast.close()
+
+    async def _run_pipeline(self, query: str, run_id: str | None = None):
+        """Plan, search, write and (optionally) email, yielding events as each stage progresses.
+
+        Stages already checkpointed for run_id in the run store are skipped.
         """
+        if self.run_deadline is not None:
+            self._deadline = asyncio.get_running_loop().time() + self.run_deadline
+        self.metrics = RunMetrics()
+        self.run_id = run_id or uuid.uuid4().hex
+        stored = None
+        if self.run_store is not None:
+            stored = self.run_store.get_run(self.run_id)
+            self.run_store.start_run(self.run_id, query)
+        yield {"type": "run", "run_id": self.run_id}
         trace_id = gen_trace_id()
         yield {"type": "status", "text": f"Trace: {trace_id}"}
         try:
             with trace("Research trace", trace_id=trace_id):
                 print("Starting research...")
-                yield {"type": "status", "text": "Planning searches..."}
-                search_plan = await self.plan_searches(query)
-
-                yield {
-                    "type": "status",
-                    "text": "Searches planned, starting to search...",
-                }
-                search_results = await self.perform_searches(search_plan)
-
-                yield {"type": "status", "text": "Searches complete, writing report..."}
-                report = await self.write_report(query, search_results)
+                if stored is not None and stored.report is not None:
+                    yield {"type": "status", "text": "Resuming run: report already written"}
+                    report = stored.report
+                else:
+                    report = None
+                    async for event in self._research(query, stored):
+                        if isinstance(event, ReportData):
+                            report = event
+                        else:
+                            yield event
 
                 email_configured = bool(
                     os.environ.get("SENDGRID_API_KEY") or os.environ.get("SMTP_SERVER")
                 )
-                if email_configured:
+                if stored is not None and stored.status == "completed":
+                    yield {"type": "status", "text": "Run already completed, not sending the report again"}
+                elif email_configured:
                     yield {"type": "status", "text": "Report written, sending email..."}
+                    started = time.perf_counter()
                     send_result = await self.send_email(report)
+                    yield self.metrics.record_stage("email", time.perf_counter() - started)
                     # Surface tool outcome for visibility
                     if isinstance(send_result, dict):
                         status = send_result.get("status")
@@ -76,66 +342,380 @@ class ResearchManager:
                         ),
                     }
 
+                if self.run_store is not None:
+                    self.run_store.finish_run(self.run_id)
                 yield {"type": "report", "markdown": report.markdown_report}
+                yield self.metrics.summary()
+        except TimeoutError as e:
+            if self.run_deadline is None:
+                yield self._fail(f"Unexpected error: timed out {e}")
+            else:
+                yield self._fail(f"Run deadline of {self.run_deadline:g}s exceeded")
         except Exception as e:
-            yield {"type": "error", "text": f"Unexpected error: {e}"}
+            yield self._fail(f"Unexpected error: {e}")
+
+    def _fail(self, text: str) -> dict:
+        """Record the run as failed in the run store and build its error event"""
+        if self.run_store is not None:
+            self.run_store.finish_run(self.run_id, text)
+        return {"type": "error", "text": text}
+
+    async def _research(self, query: str, stored: StoredRun | None):
+        """Plan, search and write, yielding events and finally the ReportData.
 
-    async def plan_searches(self, query: str) -> WebSearchPlan:
-        """Plan the searches to perform for the query"""
+        A stored plan and stored search summaries are reused instead of being produced again.
+        """
+        yield {"type": "status", "text": "Planning searches..."}
+        started = time.perf_counter()
+        if stored is not None and stored.plan is not None:
+            search_plan = stored.plan
+            yield {"type": "status", "text": "Resuming run: reusing checkpointed search plan"}
+        else:
+            search_plan = await self.plan_searches(query)
+            if self.run_store is not None:
+                self.run_store.save_plan(self.run_id, search_plan)
+        self.metrics.plan_cache_hit = self.plan_cache_hit
+        yield self.metrics.record_stage("plan", time.perf_counter() - started)
+        if self.plan_cache_hit:
+            yield {"type": "status", "text": "Reusing cached search plan"}
+
+        checkpointed = stored.searches if stored is not None else {}
+        remaining = WebSearchPlan(searches=[item for item in search_plan.searches if item.query not in checkpointed])
+        if checkpointed:
+            done = len(search_plan.searches) - len(remaining.searches)
+            yield {
+                "type": "status",
+                "text": f"Resuming run: {done} of {len(search_plan.searches)} searches already done",
+            }
+        yield {
+            "type": "status",
+            "text": "Searches planned, starting to search...",
+        }
+        outline = None
+        started = time.perf_counter()
+        search_results = list(checkpointed.values())
+        if remaining.searches and self.pipelined_writing:
+            new_results, outline = await self.search_with_outline(query, remaining)
+            search_results += new_results
+        elif remaining.searches:
+            search_results += await self.perform_searches(remaining)
+        # Checkpointed searches beyond the plan mean the gap round already ran
+        planned = {item.query for item in search_plan.searches}
+        gap_round_done = any(search_query not in planned for search_query in checkpointed)
+        if self.search_budget.gap_searches and not gap_round_done:
+            search_results += await self.fill_gaps(query, search_plan, search_results)
+        self.metrics.search_cache_hits = self.cache_stats.hits
+        self.metrics.search_cache_misses = self.cache_stats.misses
+        yield self.metrics.record_stage("search", time.perf_counter() - started)
+        if self.stragglers_dropped:
+            yield {
+                "type": "status",
+                "text": f"Proceeding without {self.stragglers_dropped} slow searches",
+            }
+        if self.summary_cache is not None:
+            yield {
+                "type": "status",
+                "text": (
+                    f"Search cache: {self.cache_stats.hits} hits, "
+                    f"{self.cache_stats.misses} misses"
+                ),
+            }
+
+        yield {"type": "status", "text": "Searches complete, writing report..."}
+        started = time.perf_counter()
+        if outline is not None:
+            report = await self.write_report(query, search_results, outline=outline)
+        else:
+            report = await self.write_report(query, search_results)
+        yield self.metrics.record_stage("write", time.perf_counter() - started)
+        if self.run_store is not None:
+            self.run_store.save_report(self.run_id, report)
+        yield report
+
+    async def plan_searches(self, query: str, budget: SearchBudget | None = None) -> WebSearchPlan:
+        """Plan the searches to perform for the query, reusing a cached plan for repeat queries.
+
+        The planner decides how many searches the query needs and how deep each should go,
+        within budget (the manager's search_budget by default).
+        """
         print("Planning searches...")
-        result = await Runner.run(
+        budget = budget or self.search_budget
+        self.plan_cache_hit = False
+        cache_key = None
+        if self.plan_cache is not None:
+            cache_key = plan_cache_key(query, str(planner_agent.model), budget.max_searches)
+            cached = self.plan_cache.get(cache_key)
+            if cached is not None:
+                self.plan_cache_hit = True
+                plan = WebSearchPlan.model_validate_json(cached)
+                return clamp_plan(plan, budget.max_searches, budget.max_context_size)
+        result = await self._run_agent(
             planner_agent,
-            f"Query: {query}",
+            (
+                f"Query: {query}\nMaximum number of searches: {budget.max_searches}\n"
+                f"Maximum search context size: {budget.max_context_size}"
+            ),
         )
-        print(f"Will perform {len(result.final_output.searches)} searches")
-        return result.final_output_as(WebSearchPlan)
+        plan = result.final_output_as(WebSearchPlan)
+        if cache_key is not None:
+            self.plan_cache.set(cache_key, plan.model_dump_json())
+        plan = clamp_plan(plan, budget.max_searches, budget.max_context_size)
+        print(f"Will perform {len(plan.searches)} searches")
+        return plan
+
+    async def fill_gaps(self, query: str, search_plan: WebSearchPlan, search_results: list[str]) -> list[str]:
+        """Run a second round of searches for aspects of the query the first round left uncovered.
+
+        Skipped when the run deadline leaves no time for another round of searches. A failure to
+        plan the follow-up searches is reported and the first round's results are used as is.
+        """
+        budget = self.search_budget
+        time_left = self._time_left()
+        if time_left is not None and time_left - self.write_reserve < self.search_timeout:
+            print("Skipping gap searches, not enough time left before the run deadline")
+            return []
+        searched = "\n".join(f"- {item.query}" for item in search_plan.searches)
+        compacted = compact_results(search_results, self.writer_token_budget)
+        input = (
+            f"Query: {query}\nMaximum number of searches: {budget.gap_searches}\n"
+            f"Maximum search context size: {budget.max_context_size}\n\n"
+            f"Searches performed:\n{searched}\n\nResults:\n\n{compacted.text}"
+        )
+        try:
+            result = await self._run_agent(gap_agent, input)
+        except Exception as e:
+            self._emit({"type": "status", "text": f"Skipping gap searches: {e}"})
+            return []
+        gap_plan = clamp_plan(result.final_output_as(WebSearchPlan), budget.gap_searches, budget.max_context_size)
+        if not gap_plan.searches:
+            self._emit({"type": "status", "text": "First round of searches covers the query, no gap searches needed"})
+            return []
+        self._emit({"type": "status", "text": f"Searching {len(gap_plan.searches)} gaps in coverage..."})
+        stragglers_dropped, search_failures = self.stragglers_dropped, self.search_failures
+        results = await self.perform_searches(gap_plan)
+        self.stragglers_dropped += stragglers_dropped
+        self.search_failures = search_failures + self.search_failures
+        return results
 
     async def perform_searches(self, search_plan: WebSearchPlan) -> list[str]:
         """Perform the searches to perform for the query"""
+        results = [result async for result in self.iter_searches(search_plan)]
+        print("Finished searching")
+        return results
+
+    async def iter_searches(self, search_plan: WebSearchPlan):
+        """Yield search summaries as they complete.
+
+        Once search_quorum of the planned searches have finished, the remaining ones get
+        straggler_grace seconds before they are cancelled and left out. Searches are also cut
+        off when the run deadline leaves only the write reserve.
+        """
         print("Searching...")
-        num_completed = 0
+        self.stragglers_dropped = 0
+        self.search_failures = []
         tasks = [
             asyncio.create_task(self.search(item)) for item in search_plan.searches
         ]
-        results = []
-        for task in asyncio.as_completed(tasks):
-            result = await task
-            if result is not None:
-                results.append(result)
-            num_completed += 1
-            print(f"Searching... {num_completed}/{len(tasks)} completed")
+        quorum = max(1, math.ceil(self.search_quorum * len(tasks)))
+        loop = asyncio.get_running_loop()
+        grace_deadline = None
+        num_completed = 0
+        pending = set(tasks)
+        try:
+            while pending:
+                timeouts = []
+                if grace_deadline is not None:
+                    timeouts.append(grace_deadline - loop.time())
+                time_left = self._time_left()
+                if time_left is not None:
+                    timeouts.append(time_left - self.write_reserve)
+                timeout = max(0.0, min(timeouts)) if timeouts else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.stragglers_dropped = len(pending)
+                    print(f"Dropping {len(pending)} searches that missed the quorum grace period or run deadline")
+                    break
+                for task in done:
+                    num_completed += 1
+                    print(f"Searching... {num_completed}/{len(tasks)} completed")
+                    result = task.result()
+                    if result is not None:
+                        yield result
+                if grace_deadline is None and num_completed >= quorum:
+                    grace_deadline = loop.time() + self.straggler_grace
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def search_with_outline(self, query: str, search_plan: WebSearchPlan) -> tuple[list[str], str | None]:
+        """Run the searches while drafting the report outline from the first half of the results"""
+        results: list[str] = []
+        outline_task = None
+        outline_after = max(1, math.ceil(len(search_plan.searches) / 2))
+        async for result in self.iter_searches(search_plan):
+            results.append(result)
+            if outline_task is None and len(results) >= outline_after:
+                outline_task = asyncio.create_task(self.draft_outline(query, list(results)))
         print("Finished searching")
-        return results
+        if outline_task is None:
+            return results, None
+        try:
+            return results, await outline_task
+        except Exception as e:
+            # The outline is an optimization; the writer can still outline on its own
+            print(f"Outline drafting failed: {e}")
+            return results, None
+
+    async def draft_outline(self, query: str, partial_results: list[str]) -> str:
+        """Draft the report outline from the search results available so far"""
+        print("Drafting outline from partial results...")
+        compacted = compact_results(partial_results, self.writer_token_budget)
+        input = f"Original query: {query}\n\nSearch results so far:\n\n{compacted.text}"
+        result = await self._run_agent(
+            outline_agent,
+            input,
+        )
+        return result.final_output_as(ReportOutline).outline
 
     async def search(self, item: WebSearchItem) -> str | None:
-        """Perform a search for the query"""
-        input = f"Search term: {item.query}\nReason for searching: {item.reason}"
+        """Perform a search for the query, serving repeated terms from the summary cache.
+
+        Concurrent searches for the same term, from this run or any other, share one agent call.
+        Timeouts and failures are reported as status events and yield None.
+        """
+        started = time.perf_counter()
+        agent = search_agent_for(item.search_context_size)
+        cache_key = search_cache_key(item.query, str(agent.model), item.search_context_size)
+        if self.summary_cache is not None:
+            cached = self.summary_cache.get(cache_key)
+            if cached is not None:
+                self.cache_stats.hits += 1
+                self._emit(self.metrics.record_search(item.query, time.perf_counter() - started, True, True))
+                self._checkpoint_search(item, cached)
+                return cached
+            self.cache_stats.misses += 1
         try:
-            result = await Runner.run(
-                search_agent,
-                input,
-            )
-            return str(result.final_output)
-        except Exception:
-            return None
+            summary = await _inflight_searches.do(cache_key, lambda: self._search_uncached(agent, item, cache_key))
+            self._emit(self.metrics.record_search(item.query, time.perf_counter() - started, False, True))
+            self._checkpoint_search(item, summary)
+            return summary
+        except TimeoutError:
+            failure = f"Search '{item.query}' timed out after {self.search_timeout:g}s"
+        except Exception as e:
+            failure = f"Search '{item.query}' failed: {e}"
+        self.search_failures.append(failure)
+        self._emit({"type": "status", "text": failure})
+        self._emit(self.metrics.record_search(item.query, time.perf_counter() - started, False, False))
+        return None
+
+    def _checkpoint_search(self, item: WebSearchItem, summary: str) -> None:
+        if self.run_store is not None and self.run_id is not None:
+            self.run_store.save_search(self.run_id, item.query, summary)
+
+    async def _search_uncached(self, agent, item: WebSearchItem, cache_key: str) -> str:
+        input = f"Search term: {item.query}\nReason for searching: {item.reason}"
+        timeout = self.search_timeout
+        time_left = self._time_left()
+        if time_left is not None:
+            timeout = min(timeout, max(0.0, time_left))
+        hedge_after = None
+        if self.hedge_percentile is not None:
+            hedge_after = _search_latency.percentile(self.hedge_percentile)
+
+        def on_hedge():
+            self._emit({"type": "status", "text": f"Search '{item.query}' is slow, sending a hedged request"})
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await asyncio.wait_for(
+            hedged(lambda: self._run_agent(agent, input), hedge_after, on_hedge),
+            timeout,
+        )
+        _search_latency.record(loop.time() - started)
+        summary = str(result.final_output)
+        if self.summary_cache is not None:
+            self.summary_cache.set(cache_key, summary)
+        return summary
 
-    async def write_report(self, query: str, search_results: list[str]) -> ReportData:
+    async def write_report(self, query: str, search_results: list[str], outline: str | None = None) -> ReportData:
         """Write the report for the query"""
         print("Thinking about report...")
-        input = f"Original query: {query}\nSummarized search results: {search_results}"
-        result = await Runner.run(
-            writer_agent,
-            input,
+        if self.map_reduce_threshold and len(search_results) >= self.map_reduce_threshold:
+            return await asyncio.wait_for(
+                self.write_report_map_reduce(query, search_results, outline),
+                self._time_left(),
+            )
+        input, compacted = build_writer_input(query, search_results, self.writer_token_budget, outline)
+        self._emit(self.metrics.record_compaction(compacted))
+        result = await asyncio.wait_for(
+            self._run_agent(
+                writer_agent,
+                input,
+                expected_output_tokens=4000,
+                stream=ReportStream(self._emit) if self.stream_report else None,
+            ),
+            self._time_left(),
         )
 
         print("Finished writing report")
         return result.final_output_as(ReportData)
 
+    async def write_report_map_reduce(
+        self, query: str, search_results: list[str], outline: str | None = None
+    ) -> ReportData:
+        """Write sections over clusters of related results in parallel, then assemble the report"""
+        clusters = cluster_results(search_results, self.sources_per_section)
+        self._emit({"type": "status", "text": f"Writing {len(clusters)} report sections in parallel..."})
+        budget = self.writer_token_budget // len(clusters) if self.writer_token_budget else None
+        outcomes = await asyncio.gather(
+            *(self.write_section(query, cluster, budget) for cluster in clusters),
+            return_exceptions=True,
+        )
+        sections = [outcome for outcome in outcomes if isinstance(outcome, ReportSection)]
+        if not sections:
+            raise next(outcome for outcome in outcomes if isinstance(outcome, BaseException))
+        if len(sections) < len(clusters):
+            self._emit(
+                {"type": "status", "text": f"{len(clusters) - len(sections)} report sections failed and were left out"}
+            )
+
+        print("Assembling report...")
+        overview = "\n".join(f"{i}. {section.title}: {section.summary}" for i, section in enumerate(sections, start=1))
+        input = f"Original query: {query}\n\nSections:\n{overview}"
+        if outline:
+            input += f"\n\nDraft outline:\n{outline}"
+        result = await self._run_agent(editor_agent, input)
+        frame = result.final_output_as(ReportFrame)
+        markdown = "\n\n".join(
+            [
+                f"# {frame.title}",
+                frame.introduction,
+                *(section.markdown for section in sections),
+                "## Conclusion",
+                frame.conclusion,
+            ]
+        )
+        print("Finished writing report")
+        return ReportData(
+            short_summary=frame.short_summary,
+            markdown_report=markdown,
+            follow_up_questions=frame.follow_up_questions,
+        )
+
+    async def write_section(self, query: str, search_results: list[str], token_budget: int | None) -> ReportSection:
+        """Write one report section from a cluster of related search results"""
+        compacted = compact_results(search_results, token_budget)
+        self._emit(self.metrics.record_compaction(compacted))
+        input = f"Original query: {query}\n\nResearch notes:\n\n{compacted.text}"
+        result = await self._run_agent(section_writer_agent, input, expected_output_tokens=1200)
+        return result.final_output_as(ReportSection)
+
     async def send_email(self, report: ReportData) -> None:
         print("Writing email...")
-        result = await Runner.run(
+        result = await self._run_agent(
             email_agent,
             report.markdown_report,
+            expected_output_tokens=3000,
         )
         # Log final tool output for debugging (success/skip/error details)
         try:
@@ -0,0 +1,94 @@
+import asyncio
+import os
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import openai
+
+# HTTP statuses worth another attempt: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    # Fraction of each backoff delay that is randomized, so concurrent retries spread out
+    jitter: float = 0.5
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before attempt number `attempt + 1`, given `attempt` failures so far."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(1 - self.jitter, 1)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an agent call failure is transient and worth retrying."""
+    if isinstance(error, openai.APIConnectionError):  # includes APITimeoutError
+        return True
+    status = getattr(error, "status_code", None)
+    return status in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Server-requested delay from Retry-After / retry-after-ms headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+async def call_with_retry(
+    fn: Callable[[], Awaitable[Any]],
+    policy: RetryPolicy,
+    on_retry: Callable[[int, float, BaseException], None] | None = None,
+) -> Any:
+    """Await fn(), retrying transient failures according to policy.
+
+    on_retry(attempt, delay, error) is called before sleeping for each retry.
+    """
+    attempt = 1
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= policy.max_attempts or not is_retryable(e):
+                raise
+            delay = retry_after_seconds(e)
+            if delay is None:
+                delay = policy.backoff(attempt)
+            if on_retry is not None:
+                on_retry(attempt, delay, e)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def retry_policy_from_env() -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=int(os.environ.get("RETRY_MAX_ATTEMPTS", "3")),
+        base_delay=float(os.environ.get("RETRY_BASE_DELAY_SECONDS", "1")),
+        max_delay=float(os.environ.get("RETRY_MAX_DELAY_SECONDS", "30")),
+    )
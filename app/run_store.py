@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.planner_agent import WebSearchPlan
+from app.writer_agent import ReportData
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        query TEXT NOT NULL,
+        status TEXT NOT NULL,
+        plan TEXT,
+        report TEXT,
+        error TEXT,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS run_searches (
+        run_id TEXT NOT NULL,
+        query TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        PRIMARY KEY (run_id, query)
+    )""",
+)
+
+
+@dataclass
+class StoredRun:
+    run_id: str
+    query: str
+    # running, completed or failed
+    status: str
+    plan: WebSearchPlan | None = None
+    # Completed search summaries keyed by search term, in completion order
+    searches: dict[str, str] = field(default_factory=dict)
+    report: ReportData | None = None
+    error: str | None = None
+
+
+class RunStore:
+    """Durable checkpoints of research runs, so interrupted runs resume and reports outlive the process.
+
+    The plan, each search summary and the report are written as soon as they exist, keyed by
+    run ID.
+    """
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def start_run(self, run_id: str, query: str) -> None:
+        """Record a new run, or mark an existing one as running again when it is resumed."""
+        now = self._clock()
+        self._write(
+            "INSERT INTO runs (run_id, query, status, created_at, updated_at) VALUES (?, ?, 'running', ?, ?) "
+            "ON CONFLICT (run_id) DO UPDATE SET status = 'running', error = NULL, updated_at = excluded.updated_at",
+            (run_id, query, now, now),
+        )
+
+    def save_plan(self, run_id: str, plan: WebSearchPlan) -> None:
+        self._write(
+            "UPDATE runs SET plan = ?, updated_at = ? WHERE run_id = ?", (plan.model_dump_json(), self._clock(), run_id)
+        )
+
+    def save_search(self, run_id: str, query: str, summary: str) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO run_searches (run_id, query, summary) VALUES (?, ?, ?)", (run_id, query, summary)
+        )
+
+    def save_report(self, run_id: str, report: ReportData) -> None:
+        self._write(
+            "UPDATE runs SET report = ?, updated_at = ? WHERE run_id = ?",
+            (report.model_dump_json(), self._clock(), run_id),
+        )
+
+    def finish_run(self, run_id: str, error: str | None = None) -> None:
+        """Mark a run completed, or failed with the given error."""
+        self._write(
+            "UPDATE runs SET status = ?, error = ?, updated_at = ? WHERE run_id = ?",
+            ("failed" if error else "completed", error, self._clock(), run_id),
+        )
+
+    def get_run(self, run_id: str) -> StoredRun | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, query, status, plan, report, error FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            searches = self._conn.execute(
+                "SELECT query, summary FROM run_searches WHERE run_id = ? ORDER BY rowid", (run_id,)
+            ).fetchall()
+        run_id, query, status, plan, report, error = row
+        return StoredRun(
+            run_id=run_id,
+            query=query,
+            status=status,
+            plan=WebSearchPlan.model_validate_json(plan) if plan else None,
+            searches=dict(searches),
+            report=ReportData.model_validate_json(report) if report else None,
+            error=error,
+        )
+
+    def unfinished_runs(self) -> list[str]:
+        """IDs of runs that were still running when the process stopped, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT run_id FROM runs WHERE status = 'running' ORDER BY created_at").fetchall()
+        return [run_id for (run_id,) in rows]
+
+
+_shared_store: dict[str, RunStore | None] = {}
+
+
+def get_run_store() -> RunStore | None:
+    """Process-wide run store at RUN_STORE_PATH, or None when runs are not persisted."""
+    if "store" not in _shared_store:
+        path = os.environ.get("RUN_STORE_PATH")
+        _shared_store["store"] = RunStore(path) if path else None
+    return _shared_store["store"]
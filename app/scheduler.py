@@ -0,0 +1,198 @@
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+
+class TokenBucket:
+    """Refilling allowance of `rate_per_minute` units, with bursts up to one minute's worth."""
+
+    def __init__(self, rate_per_minute: float, clock=time.monotonic):
+        self.capacity = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._level -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Return (positive) or charge (negative) units once the real cost of a call is known."""
+        self._level = min(self.capacity, self._level + amount)
+
+
+@dataclass
+class Slot:
+    session: str
+    estimated_tokens: int
+    waited: float = 0.0
+    actual_tokens: int | None = None
+
+
+class AgentScheduler:
+    """Process-wide gate for agent calls.
+
+    Bounds the number of calls in flight, enforces request and token rate limits, and
+    serves the least recently served waiting session first so one large run cannot starve
+    the others.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 16,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ):
+        self.max_in_flight = max_in_flight
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.in_flight = 0
+        self.granted = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._queues: dict[str, deque[tuple[asyncio.Future, int]]] = {}
+        # Grant sequence number of each session's most recent call, for least-recently-served picking
+        self._served_at: dict[str, int] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "granted": self.granted,
+            "total_wait_seconds": self.total_wait,
+            "max_wait_seconds": self.max_wait,
+        }
+
+    @asynccontextmanager
+    async def slot(self, session: str, estimated_tokens: int = 0):
+        """Hold one unit of capacity for the duration of an agent call.
+
+        Set `actual_tokens` on the yielded Slot to reconcile the token budget afterwards.
+        """
+        slot = Slot(session=session, estimated_tokens=estimated_tokens)
+        slot.waited = await self.acquire(session, estimated_tokens)
+        try:
+            yield slot
+        finally:
+            self.release(slot.estimated_tokens, slot.actual_tokens)
+
+    async def acquire(self, session: str, tokens: int = 0) -> float:
+        """Wait for capacity and return how long the caller was queued."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._queues.setdefault(session, deque()).append((waiter, tokens))
+        enqueued = loop.time()
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Capacity was granted just as the caller gave up; hand it back
+                self.release()
+            else:
+                self._discard(session, waiter)
+            raise
+        waited = loop.time() - enqueued
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def release(self, estimated_tokens: int = 0, actual_tokens: int | None = None) -> None:
+        self.in_flight -= 1
+        if self.token_bucket is not None and actual_tokens is not None:
+            self.token_bucket.adjust(estimated_tokens - actual_tokens)
+        self._dispatch()
+
+    def _discard(self, session: str, waiter: asyncio.Future) -> None:
+        queue = self._queues.get(session)
+        if queue is None:
+            return
+        for entry in list(queue):
+            if entry[0] is waiter:
+                queue.remove(entry)
+        if not queue:
+            del self._queues[session]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.in_flight < self.max_in_flight and self._queues:
+            # Least recently served session first; ties keep arrival order
+            session = min(self._queues, key=lambda name: self._served_at.get(name, -1))
+            queue = self._queues[session]
+            waiter, tokens = queue[0]
+            if waiter.done():
+                queue.popleft()
+                if not queue:
+                    del self._queues[session]
+                continue
+            delay = 0.0
+            if self.request_bucket is not None:
+                delay = max(delay, self.request_bucket.wait_time(1))
+            if self.token_bucket is not None:
+                delay = max(delay, self.token_bucket.wait_time(tokens))
+            if delay > 0:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            if self.request_bucket is not None:
+                self.request_bucket.take(1)
+            if self.token_bucket is not None:
+                self.token_bucket.take(tokens)
+            queue.popleft()
+            if not queue:
+                del self._queues[session]
+            self.granted += 1
+            self._served_at[session] = self.granted
+            if len(self._served_at) > 1024:
+                self._served_at = {name: self._served_at[name] for name in self._queues if name in self._served_at}
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+def scheduler_from_env() -> AgentScheduler:
+    rpm = os.environ.get("AGENT_REQUESTS_PER_MINUTE")
+    tpm = os.environ.get("AGENT_TOKENS_PER_MINUTE")
+    return AgentScheduler(
+        max_in_flight=int(os.environ.get("AGENT_MAX_IN_FLIGHT", "16")),
+        requests_per_minute=float(rpm) if rpm else None,
+        tokens_per_minute=float(tpm) if tpm else None,
+    )
+
+
+_scheduler: AgentScheduler | None = None
+
+
+def get_scheduler() -> AgentScheduler:
+    """Process-wide scheduler shared by every ResearchManager."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = scheduler_from_env()
+    return _scheduler
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) used for rate limiting."""
+    return len(text) // 4 + 1
@@ -1,5 +1,7 @@
 from agents import Agent, WebSearchTool, ModelSettings
 
+SEARCH_CONTEXT_SIZE = "low"
+
 INSTRUCTIONS = (
     "You are a research assistant. Given a search term, you search the web for that term and "
     "produce a concise summary of the results. The summary must 2-3 paragraphs and less than 300 "
@@ -11,9 +13,18 @@ INSTRUCTIONS = (
 search_agent = Agent(
     name="Search agent",
     instructions=INSTRUCTIONS,
-    tools=[WebSearchTool(search_context_size="low")],
+    tools=[WebSearchTool(search_context_size=SEARCH_CONTEXT_SIZE)],
     model="gpt-4o-mini",
     model_settings=ModelSettings(tool_choice="required"),
 )
 
+_search_agents = {SEARCH_CONTEXT_SIZE: search_agent}
+
 
+def search_agent_for(search_context_size: str) -> Agent:
+    """The search agent with its web search tool set to the given context size."""
+    agent = _search_agents.get(search_context_size)
+    if agent is None:
+        agent = search_agent.clone(tools=[WebSearchTool(search_context_size=search_context_size)])
+        _search_agents[search_context_size] = agent
+    return agent
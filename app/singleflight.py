@@ -0,0 +1,63 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+
+class EventBroadcast:
+    """Event log for one run that any number of subscribers can follow.
+
+    Late subscribers first replay everything published so far, then receive live events
+    until the broadcast is closed.
+    """
+
+    def __init__(self):
+        self.events: list[dict[str, Any]] = []
+        self.closed = False
+        self.task: asyncio.Task | None = None
+        self._waiters: list[asyncio.Future] = []
+
+    def publish(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+        self._wake()
+
+    def close(self) -> None:
+        self.closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def subscribe(self) -> AsyncIterator[dict[str, Any]]:
+        index = 0
+        while True:
+            if index < len(self.events):
+                yield self.events[index]
+                index += 1
+                continue
+            if self.closed:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one shared execution."""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller giving up does not cancel the work other callers share
+        return await asyncio.shield(future)
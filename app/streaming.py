@@ -0,0 +1,102 @@
+import json
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class PartialJsonString:
+    """Incrementally decode one string field out of a JSON object that is still being generated.
+
+    feed() takes the next chunk of raw JSON and returns the newly decoded part of the field's
+    value, holding back escape sequences until they are complete.
+    """
+
+    def __init__(self, key: str):
+        self._key_pattern = re.compile(rf'"{re.escape(key)}"\s*:\s*"')
+        self._buffer = ""
+        # Index in _buffer of the next undecoded character of the value, once it has started
+        self._position: int | None = None
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        self._buffer += chunk
+        if self.done:
+            return ""
+        if self._position is None:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return ""
+            self._position = match.end()
+        decoded = []
+        buffer, i = self._buffer, self._position
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.done = True
+                break
+            if char != "\\":
+                decoded.append(char)
+                i += 1
+                continue
+            if i + 1 >= len(buffer):
+                break
+            if buffer[i + 1] != "u":
+                decoded.append(_ESCAPES.get(buffer[i + 1], buffer[i + 1]))
+                i += 2
+                continue
+            # \uXXXX, or a surrogate pair of two of them
+            length = 12 if buffer[i + 2 : i + 4].lower() in ("d8", "d9", "da", "db") else 6
+            if i + length > len(buffer):
+                break
+            decoded.append(json.loads(f'"{buffer[i : i + length]}"'))
+            i += length
+        self._position = i
+        return "".join(decoded)
+
+
+class ReportStream:
+    """Turns the writer's raw structured-output deltas into `report_delta` events.
+
+    Deltas are coalesced so that at most one event is emitted per `interval` seconds. If the
+    writer call is retried, start() emits a reset event so consumers discard the partial text.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[dict[str, Any]], None],
+        key: str = "markdown_report",
+        interval: float = 0.1,
+        clock=time.monotonic,
+    ):
+        self._emit = emit
+        self.key = key
+        self.interval = interval
+        self._clock = clock
+        self._parser = PartialJsonString(key)
+        self._pending = ""
+        self._last_emit = 0.0
+        self.emitted = 0
+
+    def start(self) -> None:
+        """Begin a new attempt at generating the report."""
+        if self.emitted or self._pending:
+            self._emit({"type": "report_delta", "text": "", "reset": True})
+        self._parser = PartialJsonString(self.key)
+        self._pending = ""
+        self.emitted = 0
+
+    def feed(self, chunk: str) -> None:
+        self._pending += self._parser.feed(chunk)
+        if self._pending and self._clock() - self._last_emit >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._emit({"type": "report_delta", "text": self._pending})
+        self.emitted += len(self._pending)
+        self._pending = ""
+        self._last_emit = self._clock()
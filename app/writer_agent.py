@@ -7,7 +7,31 @@ INSTRUCTIONS = (
     "You should first come up with an outline for the report that describes the structure and "
     "flow of the report. Then, generate the report and return that as your final output.\n"
     "The final output should be in markdown format, and it should be lengthy and detailed. Aim "
-    "for 5-10 pages of content, at least 1000 words."
+    "for 5-10 pages of content, at least 1000 words.\n"
+    "If a draft outline is provided, use it as your starting structure and refine it with the full "
+    "research rather than outlining from scratch."
+)
+
+OUTLINE_INSTRUCTIONS = (
+    "You are a senior researcher preparing to write a report for a research query. "
+    "You will be provided with the original query and the first search summaries to come back; more "
+    "research is still in progress. Draft a markdown outline for the report: section headings in a "
+    "logical order, each with a few bullet points on what it should cover. Leave room for topics the "
+    "remaining research is likely to add. Keep it under 300 words."
+)
+
+SECTION_INSTRUCTIONS = (
+    "You are a senior researcher writing one section of a larger report for a research query. "
+    "You will be provided with the original query and research notes on one related group of topics. "
+    "Write a detailed markdown section (400-800 words) covering what these notes say about the query, "
+    "starting at heading level 2. Do not write an introduction or conclusion for the whole report."
+)
+
+EDITOR_INSTRUCTIONS = (
+    "You are the editor assembling a research report from sections written in parallel. "
+    "You will be provided with the original query and the title and summary of each section. "
+    "Write the report title, an introduction that frames the sections in order, a conclusion that "
+    "synthesizes them, a short summary of the findings, and follow-up research topics."
 )
 
 
@@ -19,6 +43,30 @@ class ReportData(BaseModel):
     follow_up_questions: list[str] = Field(description="Suggested topics to research further")
 
 
+class ReportOutline(BaseModel):
+    outline: str = Field(description="A markdown outline of the report sections and what each covers.")
+
+
+class ReportSection(BaseModel):
+    title: str = Field(description="The section heading.")
+
+    summary: str = Field(description="A 1-2 sentence summary of the section's key points.")
+
+    markdown: str = Field(description="The full markdown section, starting with its level 2 heading.")
+
+
+class ReportFrame(BaseModel):
+    title: str = Field(description="The report title.")
+
+    introduction: str = Field(description="An introduction in markdown framing the sections in order.")
+
+    conclusion: str = Field(description="A concluding synthesis in markdown.")
+
+    short_summary: str = Field(description="A short 2-3 sentence summary of the findings.")
+
+    follow_up_questions: list[str] = Field(description="Suggested topics to research further")
+
+
 writer_agent = Agent(
     name="WriterAgent",
     instructions=INSTRUCTIONS,
@@ -26,4 +74,23 @@ writer_agent = Agent(
     output_type=ReportData,
 )
 
+outline_agent = Agent(
+    name="OutlineAgent",
+    instructions=OUTLINE_INSTRUCTIONS,
+    model="gpt-4o-mini",
+    output_type=ReportOutline,
+)
+
+section_writer_agent = Agent(
+    name="SectionWriterAgent",
+    instructions=SECTION_INSTRUCTIONS,
+    model="gpt-4o-mini",
+    output_type=ReportSection,
+)
 
+editor_agent = Agent(
+    name="EditorAgent",
+    instructions=EDITOR_INSTRUCTIONS,
+    model="gpt-4o-mini",
+    output_type=ReportFrame,
+)
@@ -0,0 +1,134 @@
+"""Deterministic stand-in for the agents SDK Runner.
+
+Each agent gets a latency distribution, failure rate and output size. Randomness is derived
+from (seed, agent, input, attempt), so the same call always behaves the same way regardless of
+how concurrent calls interleave, while retries of a failed call can still succeed.
+"""
+
+import asyncio
+import random
+import re
+import types
+import zlib
+from dataclasses import dataclass, field
+
+import httpx
+import openai
+
+from app.planner_agent import WebSearchItem, WebSearchPlan
+from app.writer_agent import ReportData, ReportFrame, ReportOutline, ReportSection
+
+
+@dataclass
+class AgentProfile:
+    # Log-normal latency: median seconds and spread (sigma of the underlying normal)
+    median_latency: float
+    latency_sigma: float = 0.3
+    failure_rate: float = 0.0
+    # Words of generated text; for the planner, the number of searches it plans when no maximum is given
+    output_words: int = 200
+
+
+# Rough shape of real gpt-4o-mini latencies for each agent in the pipeline
+DEFAULT_PROFILES: dict[str, AgentProfile] = {
+    "PlannerAgent": AgentProfile(median_latency=2.0, output_words=5),
+    "Search agent": AgentProfile(median_latency=4.0, latency_sigma=0.5, failure_rate=0.02, output_words=250),
+    "GapAgent": AgentProfile(median_latency=2.5, output_words=100),
+    "OutlineAgent": AgentProfile(median_latency=3.0, output_words=250),
+    "WriterAgent": AgentProfile(median_latency=20.0, latency_sigma=0.25, output_words=1500),
+    "SectionWriterAgent": AgentProfile(median_latency=8.0, latency_sigma=0.25, output_words=600),
+    "EditorAgent": AgentProfile(median_latency=4.0, output_words=300),
+    "Email agent": AgentProfile(median_latency=8.0, output_words=0),
+}
+
+
+@dataclass
+class FakeRunResult:
+    final_output: object
+    context_wrapper: object = field(default=None)
+
+    def final_output_as(self, cls, raise_if_incorrect_type: bool = False):  # noqa: ANN001
+        return self.final_output
+
+
+class FakeRunner:
+    """Drop-in for `agents.Runner` (pass as `ResearchManager(runner=...)`)."""
+
+    def __init__(
+        self,
+        profiles: dict[str, AgentProfile] | None = None,
+        seed: int = 0,
+        time_scale: float = 1.0,
+    ):
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.seed = seed
+        self.time_scale = time_scale
+        self.calls: dict[str, int] = {}
+        self._attempts: dict[tuple[str, str], int] = {}
+
+    def _rng(self, agent_name: str, input: str) -> random.Random:
+        attempt = self._attempts.get((agent_name, input), 0)
+        self._attempts[(agent_name, input)] = attempt + 1
+        return random.Random(zlib.crc32(f"{self.seed}\x1f{agent_name}\x1f{input}\x1f{attempt}".encode()))
+
+    async def run(self, agent, input: str, **kwargs) -> FakeRunResult:
+        profile = self.profiles[agent.name]
+        self.calls[agent.name] = self.calls.get(agent.name, 0) + 1
+        rng = self._rng(agent.name, input)
+        await asyncio.sleep(rng.lognormvariate(0, profile.latency_sigma) * profile.median_latency * self.time_scale)
+        if rng.random() < profile.failure_rate:
+            response = httpx.Response(503, request=httpx.Request("POST", "https://fake.invalid/v1/responses"))
+            raise openai.InternalServerError("simulated transient failure", response=response, body=None)
+        output = self._output(agent.name, input, profile, rng)
+        output_tokens = profile.output_words * 4 // 3
+        usage = types.SimpleNamespace(
+            input_tokens=len(input) // 4,
+            output_tokens=output_tokens,
+            total_tokens=len(input) // 4 + output_tokens,
+        )
+        return FakeRunResult(output, types.SimpleNamespace(usage=usage))
+
+    def _output(self, agent_name: str, input: str, profile: AgentProfile, rng: random.Random) -> object:
+        words = " ".join(rng.choice(_VOCABULARY) for _ in range(profile.output_words))
+        if agent_name == "PlannerAgent":
+            query = input.splitlines()[0].removeprefix("Query: ")
+            requested = re.search(r"number of searches: (\d+)", input, re.IGNORECASE)
+            count = int(requested.group(1)) if requested else profile.output_words
+            return WebSearchPlan(
+                searches=[
+                    WebSearchItem(query=f"{query} aspect {i}", reason=f"cover aspect {i}")
+                    for i in range(max(1, count))
+                ]
+            )
+        if agent_name == "GapAgent":
+            query = input.splitlines()[0].removeprefix("Query: ")
+            allowed = int(re.search(r"number of searches: (\d+)", input, re.IGNORECASE).group(1))
+            return WebSearchPlan(
+                searches=[
+                    WebSearchItem(query=f"{query} gap {i}", reason=f"cover gap {i}")
+                    for i in range(rng.randint(0, allowed))
+                ]
+            )
+        if agent_name == "OutlineAgent":
+            return ReportOutline(outline=words)
+        if agent_name == "WriterAgent":
+            return ReportData(short_summary=words[:200], markdown_report=f"# Report\n\n{words}", follow_up_questions=[])
+        if agent_name == "SectionWriterAgent":
+            return ReportSection(title="Section", summary=words[:200], markdown=f"## Section\n\n{words}")
+        if agent_name == "EditorAgent":
+            return ReportFrame(
+                title="Report",
+                introduction=words[:400],
+                conclusion=words[:400],
+                short_summary=words[:200],
+                follow_up_questions=[],
+            )
+        if agent_name == "Email agent":
+            return {"status": "success", "via": "fake"}
+        return words
+
+
+_VOCABULARY = (
+    "research model latency throughput search summary report agent token cost cache query "
+    "result source analysis trend market data evidence benchmark system design"
+).split()
@@ -0,0 +1,124 @@
+"""Drive ResearchManager.run against the simulated runner and report latency and throughput.
+
+Usage:
+    python -m benchmarks.run_benchmark --runs 50 --concurrency 1,4,16 --time-scale 0.01
+
+No network access or API keys are needed; each run uses a distinct query so that caches and
+in-flight coalescing do not hide the pipeline's cost.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+
+from agents import set_tracing_disabled
+
+from app.research_manager import ResearchManager
+from app.retry import RetryPolicy
+from app.scheduler import AgentScheduler
+from benchmarks.fake_runner import FakeRunner
+
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(p * (len(ordered) - 1)))]
+
+
+async def _timed_run(manager: ResearchManager, query: str) -> tuple[float, bool]:
+    started = time.perf_counter()
+    ok = False
+    async for event in manager.run(query):
+        if event.get("type") == "report":
+            ok = True
+    return time.perf_counter() - started, ok
+
+
+async def run_benchmark(
+    runs: int,
+    concurrency: int,
+    runner: FakeRunner,
+    max_in_flight: int = 16,
+    manager_options: dict | None = None,
+) -> dict:
+    """Execute `runs` research runs, at most `concurrency` at a time, and summarize them."""
+    scheduler = AgentScheduler(max_in_flight=max_in_flight)
+    # Scale timeouts and backoff with simulated time so failures cost what they would in production
+    options = {
+        "use_cache": False,
+        "use_plan_cache": False,
+        "scheduler": scheduler,
+        "runner": runner,
+        "search_timeout": 90 * runner.time_scale,
+        "retry_policy": RetryPolicy(base_delay=runner.time_scale, max_delay=30 * runner.time_scale),
+        **(manager_options or {}),
+    }
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> tuple[float, bool]:
+        async with gate:
+            return await _timed_run(ResearchManager(**options), f"benchmark topic {i}")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(one(i) for i in range(runs)))
+    elapsed = time.perf_counter() - started
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [latency for latency, _ in outcomes]
+    return {
+        "runs": runs,
+        "concurrency": concurrency,
+        "completed": sum(1 for _, ok in outcomes if ok),
+        "throughput_runs_per_s": runs / elapsed,
+        "p50_s": percentile(latencies, 0.50),
+        "p95_s": percentile(latencies, 0.95),
+        "p99_s": percentile(latencies, 0.99),
+        "peak_memory_mb": peak_memory / 1_000_000,
+        "agent_calls": dict(runner.calls),
+        "scheduler_max_wait_s": scheduler.max_wait,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="research runs per concurrency level")
+    parser.add_argument("--concurrency", default="1,4", help="comma-separated concurrency levels")
+    parser.add_argument("--time-scale", type=float, default=0.01, help="multiplier on simulated latencies")
+    parser.add_argument("--max-in-flight", type=int, default=16, help="scheduler capacity for agent calls")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print one JSON object per concurrency level")
+    parser.add_argument("--max-p95", type=float, help="fail if any level's p95 run latency exceeds this (seconds)")
+    args = parser.parse_args(argv)
+
+    set_tracing_disabled(True)
+    # Email delivery is not simulated; keep it out of the measured path
+    os.environ.pop("SENDGRID_API_KEY", None)
+    os.environ.pop("SMTP_SERVER", None)
+
+    failed = False
+    for level in (int(c) for c in args.concurrency.split(",")):
+        runner = FakeRunner(seed=args.seed, time_scale=args.time_scale)
+        # The pipeline's progress prints would drown out the results
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = asyncio.run(run_benchmark(args.runs, level, runner, max_in_flight=args.max_in_flight))
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"concurrency={level:<3} completed={result['completed']}/{result['runs']} "
+                f"throughput={result['throughput_runs_per_s']:.2f} runs/s "
+                f"p50={result['p50_s']:.3f}s p95={result['p95_s']:.3f}s p99={result['p99_s']:.3f}s "
+                f"peak_mem={result['peak_memory_mb']:.1f}MB"
+            )
+        if result["completed"] < result["runs"] or (args.max_p95 is not None and result["p95_s"] > args.max_p95):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app import batch  # noqa: E402
+from benchmarks.fake_runner import FakeRunner  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_run_batch_streams_reports_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text('{"id": "a", "query": "topic a"}\n\n{"query": "topic b"}\n{"id": "c", "query": "topic c"}\n')
+    output = tmp_path / "reports.jsonl"
+    # A previous run finished "a", failed "c" and crashed while writing the next record
+    output.write_text(
+        '{"id": "a", "query": "topic a", "status": "ok", "report": "old"}\n'
+        '{"id": "c", "query": "topic c", "status": "error", "error": "boom"}\n'
+        '{"id": "3", "que'
+    )
+    runner = FakeRunner(time_scale=0.001)
+    options = {"runner": runner, "use_cache": False, "use_plan_cache": False}
+
+    counts = await batch.run_batch(jobs, output, concurrency=2, manager_options=options)
+
+    assert counts == {"skipped": 1, "ok": 2, "error": 0}
+    assert runner.calls["PlannerAgent"] == 2
+    records = [json.loads(line) for line in output.read_text().splitlines()[2:]]
+    assert len(records) == 2
+    assert sorted(record["id"] for record in records) == ["3", "c"]
+    assert all(record["report"].startswith("# Report") and record["metrics"]["scope"] == "run" for record in records)
+
+
+def test_read_jobs_requires_a_query(tmp_path):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text('{"id": "x"}\n')
+
+    with pytest.raises(ValueError, match="no 'query'"):
+        list(batch.read_jobs(jobs))
@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import types
+from pathlib import Path
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app.fanout import SearchBudget  # noqa: E402
+from benchmarks.fake_runner import AgentProfile, FakeRunner  # noqa: E402
+from benchmarks.run_benchmark import run_benchmark  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_benchmark_drives_full_pipeline_offline(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    runner = FakeRunner(
+        profiles={"Search agent": AgentProfile(median_latency=1.0, failure_rate=0.3)},
+        time_scale=0.001,
+    )
+
+    result = await run_benchmark(runs=4, concurrency=2, runner=runner)
+
+    assert result["completed"] == 4
+    assert result["agent_calls"]["PlannerAgent"] == 4
+    assert result["agent_calls"]["WriterAgent"] == 4
+    # Simulated failures are retried, so there are more search calls than planned searches
+    assert result["agent_calls"]["Search agent"] > 20
+    assert result["p50_s"] <= result["p95_s"] <= result["p99_s"]
+
+
+@pytest.mark.asyncio
+async def test_large_fan_out_writes_sections_in_parallel(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    runner = FakeRunner(time_scale=0.001)
+
+    result = await run_benchmark(
+        runs=1,
+        concurrency=1,
+        runner=runner,
+        manager_options={"search_budget": SearchBudget(max_searches=12), "map_reduce_threshold": 8, "sources_per_section": 5},
+    )
+
+    assert result["completed"] == 1
+    assert result["agent_calls"]["Search agent"] == 12
+    assert result["agent_calls"]["SectionWriterAgent"] == 3
+    assert result["agent_calls"]["EditorAgent"] == 1
+    assert "WriterAgent" not in result["agent_calls"]
+
+
+def test_fake_runner_is_deterministic_per_call():
+    agent = types.SimpleNamespace(name="Search agent")
+
+    async def outputs(seed):
+        runner = FakeRunner(seed=seed, time_scale=0)
+        return [(await runner.run(agent, f"term {i}")).final_output for i in range(3)]
+
+    assert asyncio.run(outputs(1)) == asyncio.run(outputs(1))
+    assert asyncio.run(outputs(1)) != asyncio.run(outputs(2))
@@ -0,0 +1,124 @@
+import sys
+from pathlib import Path
+import importlib.util as _import_util
+import pytest
+
+
+# Load the research_manager module directly to avoid top-level app.py collision
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+_RM_PATH = _ROOT / "app" / "research_manager.py"
+_spec = _import_util.spec_from_file_location("research_manager", str(_RM_PATH))
+if _spec and _spec.loader:
+    research_manager = _import_util.module_from_spec(_spec)  # type: ignore[assignment]
+    _spec.loader.exec_module(research_manager)  # type: ignore[attr-defined]
+else:
+    raise ImportError(f"Failed to load research_manager.py from {_RM_PATH}")
+
+from app import cache  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_ttl_and_eviction():
+    clock = FakeClock()
+    lru = cache.LRUCache(max_entries=2, ttl=10, clock=clock)
+    lru.set("a", "A")
+    lru.set("b", "B")
+    assert lru.get("a") == "A"  # 'a' is now most recently used
+    lru.set("c", "C")
+    assert lru.get("b") is None
+    assert lru.get("a") == "A"
+
+    clock.now = 11
+    assert lru.get("a") is None
+    assert lru.get("c") is None
+
+
+def test_tiered_cache_promotes_from_disk(tmp_path):
+    disk = cache.SQLiteCache(str(tmp_path / "cache.db"), ttl=60)
+    disk.set("k", "v")
+    tiered = cache.TieredCache(cache.LRUCache(max_entries=4, ttl=60), disk)
+
+    assert tiered.get("k") == "v"
+    assert tiered.memory.get("k") == "v"
+    assert tiered.get("missing") is None
+    assert (tiered.stats.hits, tiered.stats.misses) == (1, 1)
+
+
+def test_search_cache_key_normalizes_term():
+    a = cache.search_cache_key("  Quantum   Computing ", "gpt-4o-mini", "low")
+    b = cache.search_cache_key("quantum computing", "gpt-4o-mini", "low")
+    c = cache.search_cache_key("quantum computing", "gpt-4o-mini", "high")
+    assert a == b
+    assert a != c
+
+
+@pytest.mark.asyncio
+async def test_search_served_from_cache(monkeypatch):
+    calls = []
+
+    class FakeResult:
+        final_output = "summary"
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        calls.append(input)
+        return FakeResult()
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    shared = cache.TieredCache(cache.LRUCache())
+    item = research_manager.WebSearchItem(query="Solar panels", reason="r")
+
+    first = research_manager.ResearchManager(summary_cache=shared)
+    assert await first.search(item) == "summary"
+    second = research_manager.ResearchManager(summary_cache=shared)
+    assert await second.search(item) == "summary"
+
+    assert len(calls) == 1
+    assert (second.cache_stats.hits, second.cache_stats.misses) == (1, 0)
+
+
+def test_plan_cache_key_folds_punctuation():
+    a = cache.plan_cache_key("What's new in RAG?", "gpt-4o-mini", 5)
+    b = cache.plan_cache_key("what s new   in rag", "gpt-4o-mini", 5)
+    assert a == b
+    assert a != cache.plan_cache_key("what s new in rag", "gpt-4o-mini", 10)
+
+
+@pytest.mark.asyncio
+async def test_plan_served_from_cache_unless_opted_out(monkeypatch):
+    calls = []
+    plan = research_manager.WebSearchPlan(searches=[research_manager.WebSearchItem(query="q", reason="r")])
+
+    class FakeResult:
+        final_output = plan
+
+        def final_output_as(self, cls):  # noqa: ANN001
+            return plan
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        calls.append(input)
+        return FakeResult()
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    shared = cache.TieredCache(cache.LRUCache())
+    first = research_manager.ResearchManager(plan_cache=shared)
+    await first.plan_searches("Fusion energy?")
+    assert not first.plan_cache_hit
+
+    second = research_manager.ResearchManager(plan_cache=shared)
+    assert await second.plan_searches("fusion  energy") == plan
+    assert second.plan_cache_hit
+
+    opted_out = research_manager.ResearchManager(plan_cache=shared, use_plan_cache=False)
+    await opted_out.plan_searches("fusion energy")
+    assert len(calls) == 2
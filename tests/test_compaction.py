@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app import compaction  # noqa: E402
+
+
+def test_near_duplicate_sentences_are_dropped_across_sources():
+    results = [
+        "Solid-state batteries promise higher energy density than lithium-ion cells. Toyota plans a 2027 launch.",
+        "Solid state batteries promise much higher energy density than lithium ion cells.\n\n"
+        "Samsung SDI is piloting production lines.",
+    ]
+
+    compacted = compaction.compact_results(results)
+
+    assert compacted.sentences_dropped == 1
+    assert compacted.text.count("energy density") == 1
+    assert "### Source 2\nSamsung SDI is piloting production lines." in compacted.text
+    assert "\\n" not in compacted.text and "['" not in compacted.text
+
+
+def test_token_budget_keeps_leading_points_of_every_source():
+    results = [" ".join(f"Alpha fact number {i} is here." for i in range(20)), "Beta lead point. Beta detail."]
+
+    compacted = compaction.compact_results(results, token_budget=40)
+
+    assert compacted.tokens_after <= 60
+    assert "Alpha fact number 0 is here." in compacted.text
+    assert "Beta lead point." in compacted.text
+    assert "Alpha fact number 19" not in compacted.text
+
+
+def test_build_writer_input_includes_query_and_outline():
+    text, compacted = compaction.build_writer_input("What is RAG?", ["- RAG   retrieves documents."], outline="## Intro")
+
+    assert text.startswith("Original query: What is RAG?")
+    assert "- RAG retrieves documents." in text
+    assert text.endswith("Draft outline:\n## Intro")
+    assert compacted.tokens_before > 0
+
+
+def test_cluster_results_groups_related_summaries():
+    results = [
+        "Solid-state batteries raise energy density for electric vehicles.",
+        "Interest rates were held steady by the central bank this quarter.",
+        "Solid-state batteries raise energy density and improve safety.",
+        "The central bank held interest rates steady again.",
+    ]
+
+    clusters = compaction.cluster_results(results, group_size=2)
+
+    assert clusters == [[results[0], results[2]], [results[1], results[3]]]
@@ -5,6 +5,9 @@ import importlib.util as _import_util
 
 # Load the email_agent module directly from file to avoid import issues with top-level app.py
 _ROOT = Path(__file__).resolve().parents[1]
+# Ensure the project root is importable so 'app' package resolves during module execution
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
 _EMAIL_AGENT_PATH = _ROOT / "app" / "email_agent.py"
 _spec = _import_util.spec_from_file_location("email_agent", str(_EMAIL_AGENT_PATH))
 if _spec and _spec.loader:
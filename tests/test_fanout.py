@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app.fanout import SearchBudget, clamp_plan, search_budget_from_env  # noqa: E402
+from app.planner_agent import WebSearchItem, WebSearchPlan  # noqa: E402
+
+
+def test_clamp_plan_trims_searches_and_context_size():
+    plan = WebSearchPlan(
+        searches=[
+            WebSearchItem(query="a", reason="r", search_context_size="high"),
+            WebSearchItem(query="b", reason="r"),
+            WebSearchItem(query="c", reason="r", search_context_size="medium"),
+        ]
+    )
+
+    clamped = clamp_plan(plan, max_searches=2, max_context_size="medium")
+
+    assert [(item.query, item.search_context_size) for item in clamped.searches] == [("a", "medium"), ("b", "low")]
+
+
+def test_search_budget_from_env(monkeypatch):
+    monkeypatch.setenv("HOW_MANY_SEARCHES", "20")
+    monkeypatch.setenv("SEARCH_MAX_CONTEXT_SIZE", "high")
+    monkeypatch.setenv("SEARCH_GAP_ROUND_SEARCHES", "3")
+
+    assert search_budget_from_env() == SearchBudget(max_searches=20, max_context_size="high", gap_searches=3)
+
+    monkeypatch.setenv("SEARCH_MAX_CONTEXT_SIZE", "huge")
+    with pytest.raises(ValueError):
+        search_budget_from_env()
@@ -0,0 +1,74 @@
+import asyncio
+import sys
+from pathlib import Path
+import importlib.util as _import_util
+import pytest
+
+
+# Load the research_manager module directly to avoid top-level app.py collision
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+_RM_PATH = _ROOT / "app" / "research_manager.py"
+_spec = _import_util.spec_from_file_location("research_manager", str(_RM_PATH))
+if _spec and _spec.loader:
+    research_manager = _import_util.module_from_spec(_spec)  # type: ignore[assignment]
+    _spec.loader.exec_module(research_manager)  # type: ignore[attr-defined]
+else:
+    raise ImportError(f"Failed to load research_manager.py from {_RM_PATH}")
+
+from app import hedging  # noqa: E402
+
+
+def test_latency_tracker_needs_min_samples():
+    tracker = hedging.LatencyTracker(min_samples=3)
+    tracker.record(1.0)
+    tracker.record(2.0)
+    assert tracker.percentile(0.9) is None
+    tracker.record(10.0)
+    assert tracker.percentile(0.5) == 2.0
+    assert tracker.percentile(1.0) == 10.0
+
+
+@pytest.mark.asyncio
+async def test_hedged_takes_first_success_and_cancels_other():
+    attempts = []
+    cancelled = []
+
+    async def call():
+        attempt = len(attempts)
+        attempts.append(attempt)
+        try:
+            # The first attempt hangs; the hedge answers quickly
+            await asyncio.sleep(10 if attempt == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    hedges = []
+    result = await hedging.hedged(call, hedge_after=0.01, on_hedge=lambda: hedges.append(1))
+    await asyncio.sleep(0)
+
+    assert result == 1
+    assert hedges == [1]
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio
+async def test_search_timeout_reported_as_status_event(monkeypatch):
+    async def hanging_run(agent, input):  # noqa: ANN001
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(research_manager.Runner, "run", hanging_run)
+
+    mgr = research_manager.ResearchManager(use_cache=False, search_timeout=0.01)
+    broadcast = research_manager.EventBroadcast()
+    mgr._broadcast = broadcast
+    result = await mgr.search(research_manager.WebSearchItem(query="hung term", reason="r"))
+
+    assert result is None
+    assert mgr.search_failures == ["Search 'hung term' timed out after 0.01s"]
+    assert {"type": "status", "text": "Search 'hung term' timed out after 0.01s"} in broadcast.events
+    search_metrics = [ev for ev in broadcast.events if ev.get("scope") == "search"]
+    assert search_metrics[0]["ok"] is False
@@ -0,0 +1,64 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app.jobs import JobQueue  # noqa: E402
+from benchmarks.fake_runner import FakeRunner  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_background_and_can_be_polled_or_subscribed(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    runner = FakeRunner(time_scale=0.001)
+    queue = JobQueue(workers=2, manager_options={"runner": runner, "use_cache": False, "use_plan_cache": False})
+    try:
+        first = queue.submit("first topic")
+        second = queue.submit("second topic")
+        third = queue.submit("third topic")
+        assert queue.poll(third)["status"] == "queued"
+
+        # A client that stops listening partway does not stop the job
+        async for event in queue.subscribe(first):
+            if event["type"] == "run":
+                break
+        events = [event async for event in queue.subscribe(second)]
+        while queue.get(third).status != "completed":
+            await asyncio.sleep(0.01)
+
+        assert events[0]["text"].startswith(f"Job {second} queued")
+        assert {"type": "run", "run_id": second} in events
+        assert queue.get(first).status == "completed"
+        polled = queue.poll(third, after=1)
+        assert polled["status"] == "completed"
+        assert polled["next"] == len(queue.get(third).broadcast.events)
+        assert polled["events"][-1]["scope"] == "run"
+        assert queue.get(third).report.startswith("# Report")
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_jobs_can_run_in_worker_processes(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    options = {"runner": FakeRunner(time_scale=0.001), "use_cache": False, "use_plan_cache": False}
+    queue = JobQueue(workers=1, processes=2, manager_options=options)
+    try:
+        job_ids = [queue.submit(f"topic {i}") for i in range(3)]
+        for job_id in job_ids:
+            events = [event async for event in queue.subscribe(job_id)]
+            assert {"type": "run", "run_id": job_id} in events
+        assert [queue.get(job_id).status for job_id in job_ids] == ["completed"] * 3
+
+        with pytest.raises(KeyError):
+            queue.poll("missing")
+    finally:
+        await queue.stop()
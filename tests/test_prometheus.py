@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app import prometheus  # noqa: E402
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = prometheus.Histogram("test_latency_seconds", "Test latency.", (1.0, 5.0))
+    hist.observe(0.5, stage="plan")
+    hist.observe(3.0, stage="plan")
+    hist.observe(10.0, stage="plan")
+
+    lines = hist.render()
+    assert "# TYPE test_latency_seconds histogram" in lines
+    assert 'test_latency_seconds_bucket{stage="plan",le="1.0"} 1' in lines
+    assert 'test_latency_seconds_bucket{stage="plan",le="5.0"} 2' in lines
+    assert 'test_latency_seconds_bucket{stage="plan",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_count{stage="plan"} 3' in lines
+
+
+def test_observe_event_updates_counters():
+    failed_before = prometheus.SEARCHES.value(outcome="failed")
+    errors_before = prometheus.RUNS.value(outcome="error")
+
+    prometheus.observe_event(
+        {"type": "metrics", "scope": "search", "query": "q", "duration": 1.0, "cached": False, "ok": False}
+    )
+    prometheus.observe_event({"type": "error", "text": "boom"})
+    prometheus.observe_event({"type": "status", "text": "ignored"})
+
+    assert prometheus.SEARCHES.value(outcome="failed") == failed_before + 1
+    assert prometheus.RUNS.value(outcome="error") == errors_before + 1
+    assert "deep_research_agent_calls_queued 0" in prometheus.render()
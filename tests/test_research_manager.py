@@ -1,4 +1,6 @@
+import asyncio
 import sys
+import types
 from pathlib import Path
 import importlib.util as _import_util
 import pytest
@@ -74,3 +76,182 @@ async def test_research_manager_happy_path_no_email(monkeypatch):
         ev.get("type") == "status" and "Email sending is disabled" in ev.get("text", "")
         for ev in events
     )
+
+
+@pytest.mark.asyncio
+async def test_perform_searches_proceeds_once_quorum_reached(monkeypatch):
+    async def fake_search(self, item):  # noqa: ANN001
+        if item.query == "slow":
+            await asyncio.sleep(30)
+        return f"summary of {item.query}"
+
+    monkeypatch.setattr(research_manager.ResearchManager, "search", fake_search)
+
+    WebSearchItem = research_manager.WebSearchItem
+    plan = research_manager.WebSearchPlan(
+        searches=[WebSearchItem(query=q, reason="r") for q in ("a", "b", "c", "slow")]
+    )
+    mgr = research_manager.ResearchManager(search_quorum=0.75, straggler_grace=0.01)
+    results = await asyncio.wait_for(mgr.perform_searches(plan), timeout=5)
+
+    assert sorted(results) == ["summary of a", "summary of b", "summary of c"]
+    assert mgr.stragglers_dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_pipelined_writing_passes_draft_outline_to_writer(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    WebSearchItem = research_manager.WebSearchItem
+    seen = {}
+
+    async def fake_plan_searches(self, query):  # noqa: ANN001
+        return research_manager.WebSearchPlan(searches=[WebSearchItem(query=q, reason="r") for q in ("a", "b")])
+
+    async def fake_search(self, item):  # noqa: ANN001
+        return f"summary of {item.query}"
+
+    async def fake_draft_outline(self, query, partial_results):  # noqa: ANN001
+        seen["partial"] = list(partial_results)
+        return "## Outline"
+
+    async def fake_write_report(self, query, results, outline=None):  # noqa: ANN001
+        seen["outline"] = outline
+        return research_manager.ReportData(short_summary="ss", markdown_report="Report", follow_up_questions=[])
+
+    monkeypatch.setattr(research_manager.ResearchManager, "plan_searches", fake_plan_searches)
+    monkeypatch.setattr(research_manager.ResearchManager, "search", fake_search)
+    monkeypatch.setattr(research_manager.ResearchManager, "draft_outline", fake_draft_outline)
+    monkeypatch.setattr(research_manager.ResearchManager, "write_report", fake_write_report)
+
+    mgr = research_manager.ResearchManager(pipelined_writing=True)
+    events = [ev async for ev in mgr.run("pipelined query")]
+
+    assert {"type": "report", "markdown": "Report"} in events
+    assert len(seen["partial"]) == 1
+    assert seen["outline"] == "## Outline"
+
+
+@pytest.mark.asyncio
+async def test_run_emits_stage_and_agent_call_metrics(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    WebSearchItem = research_manager.WebSearchItem
+    plan = research_manager.WebSearchPlan(searches=[WebSearchItem(query="metrics term", reason="r")])
+    report = research_manager.ReportData(short_summary="ss", markdown_report="Report", follow_up_questions=[])
+
+    class FakeResult:
+        def __init__(self, output):
+            self.final_output = output
+            usage = types.SimpleNamespace(input_tokens=10, output_tokens=5, total_tokens=15)
+            self.context_wrapper = types.SimpleNamespace(usage=usage)
+
+        def final_output_as(self, cls):  # noqa: ANN001
+            return self.final_output
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        outputs = {"PlannerAgent": plan, "Search agent": "summary", "WriterAgent": report}
+        return FakeResult(outputs[agent.name])
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    mgr = research_manager.ResearchManager(use_cache=False, use_plan_cache=False)
+    events = [ev async for ev in mgr.run("metrics query")]
+    metrics = [ev for ev in events if ev["type"] == "metrics"]
+
+    assert [ev["stage"] for ev in metrics if ev["scope"] == "stage"] == ["plan", "search", "write"]
+    assert [ev["agent"] for ev in metrics if ev["scope"] == "agent_call"] == [
+        "PlannerAgent",
+        "Search agent",
+        "WriterAgent",
+    ]
+    assert [ev["query"] for ev in metrics if ev["scope"] == "search"] == ["metrics term"]
+    summary = metrics[-1]
+    assert summary["scope"] == "run"
+    assert summary["agent_calls"] == 3
+    assert summary["total_tokens"] == 45
+    assert summary["tokens_by_agent"]["WriterAgent"] == 15
+
+
+@pytest.mark.asyncio
+async def test_gap_round_searches_uncovered_aspects_at_planned_depth(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    WebSearchItem = research_manager.WebSearchItem
+    WebSearchPlan = research_manager.WebSearchPlan
+    plan = WebSearchPlan(searches=[WebSearchItem(query="overview", reason="r", search_context_size="high")])
+    gaps = WebSearchPlan(searches=[WebSearchItem(query="gap one", reason="r"), WebSearchItem(query="gap two", reason="r")])
+    seen = {"searches": [], "writer_input": None}
+
+    class FakeResult:
+        def __init__(self, output):
+            self.final_output = output
+
+        def final_output_as(self, cls):  # noqa: ANN001
+            return self.final_output
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        if agent.name == "Search agent":
+            seen["searches"].append((input.splitlines()[0], agent.tools[0].search_context_size))
+            return FakeResult(f"Findings for {input.splitlines()[0]}.")
+        if agent.name == "WriterAgent":
+            seen["writer_input"] = input
+            report = research_manager.ReportData(short_summary="ss", markdown_report="Report", follow_up_questions=[])
+            return FakeResult(report)
+        return FakeResult({"PlannerAgent": plan, "GapAgent": gaps}[agent.name])
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    budget = research_manager.SearchBudget(max_searches=3, max_context_size="medium", gap_searches=1)
+    mgr = research_manager.ResearchManager(use_cache=False, use_plan_cache=False, search_budget=budget)
+    events = [ev async for ev in mgr.run("gap round query")]
+
+    assert {"type": "report", "markdown": "Report"} in events
+    assert {"type": "status", "text": "Searching 1 gaps in coverage..."} in events
+    assert seen["searches"] == [("Search term: overview", "medium"), ("Search term: gap one", "low")]
+    assert "Findings for Search term: gap one." in seen["writer_input"]
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_checkpointed_stages(monkeypatch, tmp_path):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    WebSearchItem = research_manager.WebSearchItem
+    plan = research_manager.WebSearchPlan(searches=[WebSearchItem(query=q, reason="r") for q in ("done", "todo")])
+    store = research_manager.RunStore(str(tmp_path / "runs.db"))
+    store.start_run("run-1", "resumable query")
+    store.save_plan("run-1", plan)
+    store.save_search("run-1", "done", "Checkpointed summary.")
+    calls = []
+
+    class FakeResult:
+        def __init__(self, output):
+            self.final_output = output
+
+        def final_output_as(self, cls):  # noqa: ANN001
+            return self.final_output
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        calls.append(agent.name)
+        if agent.name == "WriterAgent":
+            assert "Checkpointed summary." in input and "Fresh summary." in input
+            return FakeResult(research_manager.ReportData(short_summary="ss", markdown_report="Report", follow_up_questions=[]))
+        return FakeResult("Fresh summary.")
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    mgr = research_manager.ResearchManager(use_cache=False, use_plan_cache=False, run_store=store)
+    events = [ev async for ev in mgr.resume("run-1")]
+
+    assert events[0] == {"type": "run", "run_id": "run-1"}
+    assert {"type": "report", "markdown": "Report"} in events
+    assert calls == ["Search agent", "WriterAgent"]
+    stored = store.get_run("run-1")
+    assert stored.status == "completed"
+    assert stored.report.markdown_report == "Report"
+    assert set(stored.searches) == {"done", "todo"}
+
+    # Resuming a completed run replays the stored report without calling any agent
+    events = [ev async for ev in research_manager.ResearchManager(run_store=store).resume("run-1")]
+    assert {"type": "report", "markdown": "Report"} in events
+    assert calls == ["Search agent", "WriterAgent"]
@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import httpx
+import openai
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app import retry  # noqa: E402
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> openai.APIStatusError:
+    response = httpx.Response(status, headers=headers, request=httpx.Request("POST", "https://api.test/v1"))
+    return openai.APIStatusError("boom", response=response, body=None)
+
+
+def test_retryable_classification_and_retry_after():
+    assert retry.is_retryable(_status_error(429))
+    assert retry.is_retryable(_status_error(503))
+    assert not retry.is_retryable(_status_error(400))
+    assert not retry.is_retryable(ValueError("bad output"))
+
+    assert retry.retry_after_seconds(_status_error(429, {"retry-after": "7"})) == 7.0
+    assert retry.retry_after_seconds(_status_error(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry.retry_after_seconds(_status_error(500)) is None
+
+
+@pytest.mark.asyncio
+async def test_call_with_retry_recovers_from_transient_errors():
+    attempts = []
+    retries = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _status_error(502)
+        return "ok"
+
+    policy = retry.RetryPolicy(max_attempts=3, base_delay=0.001, jitter=0)
+    result = await retry.call_with_retry(flaky, policy, lambda n, delay, e: retries.append(n))
+
+    assert result == "ok"
+    assert retries == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_call_with_retry_gives_up_on_permanent_errors():
+    attempts = []
+
+    async def broken():
+        attempts.append(1)
+        raise _status_error(401)
+
+    with pytest.raises(openai.APIStatusError):
+        await retry.call_with_retry(broken, retry.RetryPolicy(base_delay=0.001))
+    assert len(attempts) == 1
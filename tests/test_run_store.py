@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app.planner_agent import WebSearchItem, WebSearchPlan  # noqa: E402
+from app.run_store import RunStore  # noqa: E402
+from app.writer_agent import ReportData  # noqa: E402
+
+
+def test_checkpoints_survive_reopening_the_store(tmp_path):
+    path = str(tmp_path / "runs.db")
+    store = RunStore(path)
+    plan = WebSearchPlan(searches=[WebSearchItem(query="a", reason="r"), WebSearchItem(query="b", reason="r")])
+    store.start_run("run-1", "topic")
+    store.save_plan("run-1", plan)
+    store.save_search("run-1", "b", "summary b")
+    store.save_search("run-1", "a", "summary a")
+    store.start_run("run-2", "other topic")
+    store.finish_run("run-2", "boom")
+
+    reopened = RunStore(path)
+    run = reopened.get_run("run-1")
+
+    assert run.status == "running" and run.query == "topic"
+    assert run.plan == plan
+    assert list(run.searches.items()) == [("b", "summary b"), ("a", "summary a")]
+    assert run.report is None
+    assert reopened.unfinished_runs() == ["run-1"]
+    assert reopened.get_run("run-2").error == "boom"
+    assert reopened.get_run("missing") is None
+
+
+def test_finished_report_can_be_fetched_later(tmp_path):
+    store = RunStore(str(tmp_path / "runs.db"))
+    report = ReportData(short_summary="ss", markdown_report="# Report", follow_up_questions=["next?"])
+    store.start_run("run-1", "topic")
+    store.save_report("run-1", report)
+    store.finish_run("run-1")
+
+    run = store.get_run("run-1")
+
+    assert run.status == "completed"
+    assert run.report == report
+    assert store.unfinished_runs() == []
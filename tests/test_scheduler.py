@@ -0,0 +1,71 @@
+import asyncio
+import sys
+from pathlib import Path
+import pytest
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from app import scheduler  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = scheduler.TokenBucket(rate_per_minute=60, clock=clock)
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+    clock.now = 2.0
+    assert bucket.wait_time(2) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_in_flight_and_serves_sessions_round_robin():
+    sched = scheduler.AgentScheduler(max_in_flight=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def call(session, label):
+        async with sched.slot(session):
+            order.append(label)
+            await gate.wait()
+
+    # "big" queues three calls before "small" queues one; small must not wait behind all of them
+    tasks = [asyncio.create_task(call("big", f"big{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("small", "small0")))
+    await asyncio.sleep(0)
+
+    assert sched.in_flight == 1
+    assert sched.queue_depth == 3
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["big0", "small0", "big1", "big2"]
+    assert sched.stats()["granted"] == 4
+    assert sched.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    sched = scheduler.AgentScheduler(max_in_flight=1)
+    await sched.acquire("a")
+    waiting = asyncio.create_task(sched.acquire("b"))
+    await asyncio.sleep(0)
+    assert sched.queue_depth == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert sched.queue_depth == 0
+    sched.release()
+    assert sched.in_flight == 0
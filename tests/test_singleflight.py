@@ -0,0 +1,85 @@
+import asyncio
+import sys
+from pathlib import Path
+import importlib.util as _import_util
+import pytest
+
+
+# Load the research_manager module directly to avoid top-level app.py collision
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+_RM_PATH = _ROOT / "app" / "research_manager.py"
+_spec = _import_util.spec_from_file_location("research_manager", str(_RM_PATH))
+if _spec and _spec.loader:
+    research_manager = _import_util.module_from_spec(_spec)  # type: ignore[assignment]
+    _spec.loader.exec_module(research_manager)  # type: ignore[attr-defined]
+else:
+    raise ImportError(f"Failed to load research_manager.py from {_RM_PATH}")
+
+
+@pytest.mark.asyncio
+async def test_identical_runs_share_one_pipeline(monkeypatch):
+    monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+    monkeypatch.delenv("SMTP_SERVER", raising=False)
+    WebSearchItem = research_manager.WebSearchItem
+    WebSearchPlan = research_manager.WebSearchPlan
+    plans = []
+    release = asyncio.Event()
+
+    async def fake_plan_searches(self, query):  # noqa: ANN001
+        plans.append(query)
+        await release.wait()
+        return WebSearchPlan(searches=[WebSearchItem(query="q1", reason="r1")])
+
+    async def fake_perform_searches(self, plan):  # noqa: ANN001
+        return ["summary"]
+
+    async def fake_write_report(self, query, results):  # noqa: ANN001
+        return research_manager.ReportData(short_summary="ss", markdown_report="Shared report", follow_up_questions=[])
+
+    monkeypatch.setattr(research_manager.ResearchManager, "plan_searches", fake_plan_searches)
+    monkeypatch.setattr(research_manager.ResearchManager, "perform_searches", fake_perform_searches)
+    monkeypatch.setattr(research_manager.ResearchManager, "write_report", fake_write_report)
+
+    async def collect(query):
+        mgr = research_manager.ResearchManager(use_cache=False, use_plan_cache=False)
+        return [ev async for ev in mgr.run(query)]
+
+    first = asyncio.create_task(collect("Deep sea mining"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(collect("deep sea mining!"))
+    await asyncio.sleep(0)
+    release.set()
+    first_events, second_events = await asyncio.gather(first, second)
+
+    assert plans == ["Deep sea mining"]
+    assert {"type": "report", "markdown": "Shared report"} in first_events
+    assert "Joining identical research run" in second_events[0]["text"]
+    # The joiner replays the full event log of the leader
+    assert second_events[1:] == first_events
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_agent_call(monkeypatch):
+    calls = []
+
+    class FakeResult:
+        final_output = "summary"
+
+    async def fake_run(agent, input):  # noqa: ANN001
+        calls.append(input)
+        await asyncio.sleep(0.01)
+        return FakeResult()
+
+    monkeypatch.setattr(research_manager.Runner, "run", fake_run)
+
+    a = research_manager.ResearchManager(use_cache=False)
+    b = research_manager.ResearchManager(use_cache=False)
+    results = await asyncio.gather(
+        a.search(research_manager.WebSearchItem(query="Tidal power", reason="r1")),
+        b.search(research_manager.WebSearchItem(query="tidal power", reason="r2")),
+    )
+
+    assert results == ["summary", "summary"]
+    assert len(calls) == 1